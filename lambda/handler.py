@@ -2,7 +2,7 @@
 DC Permit Navigator - RAG Query Lambda
 
 Handles natural language questions about DC permits by:
-1. Loading pre-built FAISS index from S3 (cached in /tmp)
+1. Loading pre-built FAISS index from S3 (cached in memory)
 2. Embedding the user's query via Bedrock Titan Embeddings v2
 3. Searching FAISS for top-k most relevant permit chunks
 4. Generating a natural language answer via Bedrock Claude Haiku
@@ -11,148 +11,343 @@ Handles natural language questions about DC permits by:
 import json
 import os
 import struct
-import tempfile
 import time
 import traceback
-from pathlib import Path
 
 import boto3
+import numpy as np
+import orjson
+from botocore.config import Config
+
+try:
+    import simsimd  # SIMD int8 dot-product kernels (AVX-512 VNNI / NEON)
+except ImportError:
+    simsimd = None
 
 # Lazy-loaded globals (persist across warm invocations)
 _faiss_index = None
-_chunks = None
+_chunks_texts = None  # list[str], one pre-joined text per index row
+_chunks_meta = None  # list[dict], permit metadata per index row
 _bedrock = None
+_bedrock_llm = None
 _s3 = None
+_dynamodb = None
 
 BUCKET_NAME = os.environ.get("BUCKET_NAME", "")
 INDEX_KEY = os.environ.get("INDEX_KEY", "data/embeddings/permits.index")
 CHUNKS_KEY = os.environ.get("CHUNKS_KEY", "data/embeddings/chunks.json")
 
 EMBEDDING_MODEL = "amazon.titan-embed-text-v2:0"
+EMBEDDING_DIMENSIONS = int(os.environ.get("EMBEDDING_DIMENSIONS", "256"))  # must match the built index
 LLM_MODEL = "anthropic.claude-3-haiku-20240307-v1:0"
 
+# Static instructions, sent in Claude's system field rather than rebuilt into
+# every user message
+SYSTEM_PROMPT = """You are the DC Permit Navigator, a helpful assistant that answers questions about Washington DC government permits, licenses, and certifications.
+
+You have access to a database of 103+ DC permits across 16 agencies. Use ONLY the provided context to answer questions. If the context doesn't contain enough information to fully answer the question, say so and suggest which agency to contact.
+
+Rules:
+- Be specific: include permit names, agencies, fees, requirements, and application URLs when available
+- If multiple permits might be needed, list all of them
+- Always mention the issuing agency by full name
+- Include direct links to apply when available
+- If you're not sure, say so — don't guess about government requirements
+- Be concise but thorough
+- Format your response with markdown for readability"""
+
+# Pre-built request bodies: only the text varies per call, so the constant
+# fields are serialized once and the JSON-escaped text is spliced in
+_EMBED_PREFIX = b'{"inputText":'
+_EMBED_SUFFIX = b',"dimensions":%d,"normalize":true}' % EMBEDDING_DIMENSIONS
+_LLM_PREFIX = (
+    orjson.dumps(
+        {
+            "anthropic_version": "bedrock-2023-05-31",
+            "max_tokens": 1024,
+            "temperature": 0.2,
+            "system": SYSTEM_PROMPT,
+        }
+    )[:-1]
+    + b',"messages":[{"role":"user","content":'
+)
+_LLM_SUFFIX = b"}]}"
+
 TOP_K = 5
+NORM_TOLERANCE = 1e-3  # max deviation from unit length for stored vectors
+INT8_NORM_TOLERANCE = 1e-2  # looser bound for dequantized INT8 vectors
+
+# Binary index header, must match scripts/build_index.py
+INDEX_HEADER = "<4sBBHII"  # magic, version, dtype, flags, num_vectors, dimensions
+INDEX_MAGIC = b"DCPI"
+INDEX_VERSION = 1
+DTYPE_F32 = 0
+DTYPE_I8 = 1
+DTYPE_F16 = 2
+FLAG_SIGN_BITS = 1  # header flag: packed sign-bit block follows the vectors
+
+# Binary-quantized prefilter, only worth it once the index is large
+PREFILTER_MIN_VECTORS = 10_000  # must match scripts/build_index.py
+PREFILTER_FACTOR = 4  # candidates kept per requested result
+
 MAX_DAILY_QUERIES = 200  # Cost protection
 
-# Simple daily counter file in /tmp
+# Daily query counter: one DynamoDB item per day, shared by all containers.
+# Without a table (local runs) fall back to a per-container file in /tmp.
+COUNTER_TABLE = os.environ.get("COUNTER_TABLE", "")
+COUNTER_TTL_SECONDS = 2 * 24 * 3600  # expire old day items automatically
 COUNTER_FILE = "/tmp/query_counter.json"
 
 
+# Client configs keep connections alive across invocations. Worst case per
+# call (attempts x (connect + read timeout)) stays under the function's 30s
+# Timeout, so a stalled call fails inside the handler and the browser gets
+# the CORS-headed 500 instead of an opaque Lambda timeout.
+# Bedrock embeddings: short Titan calls, cheap to retry; 2 x 12s = 24s
+_bedrock_config = Config(
+    retries={"mode": "adaptive", "total_max_attempts": 2},
+    tcp_keepalive=True,
+    connect_timeout=2,
+    read_timeout=10,
+)
+# Bedrock Claude: non-streaming invoke_model sends nothing until the whole
+# answer (up to max_tokens) is generated, so give it most of the budget and
+# never retry. A timed-out answer is still billed, and retrying it would
+# bill it twice. 1 x 24s = 24s
+_llm_config = Config(
+    retries={"mode": "standard", "total_max_attempts": 1},
+    tcp_keepalive=True,
+    connect_timeout=2,
+    read_timeout=22,
+)
+# S3 / DynamoDB: small objects and single-item updates; 3 x 5s = 15s
+_aws_config = Config(
+    retries={"mode": "standard", "total_max_attempts": 3},
+    tcp_keepalive=True,
+    connect_timeout=2,
+    read_timeout=3,
+)
+
+
 def get_s3():
     global _s3
     if _s3 is None:
-        _s3 = boto3.client("s3")
+        _s3 = boto3.client("s3", config=_aws_config)
     return _s3
 
 
 def get_bedrock():
     global _bedrock
     if _bedrock is None:
-        _bedrock = boto3.client("bedrock-runtime")
+        _bedrock = boto3.client("bedrock-runtime", config=_bedrock_config)
     return _bedrock
 
 
-def load_index():
-    """Load FAISS index and chunks from S3, caching in /tmp."""
-    global _faiss_index, _chunks
+def get_bedrock_llm():
+    global _bedrock_llm
+    if _bedrock_llm is None:
+        _bedrock_llm = boto3.client("bedrock-runtime", config=_llm_config)
+    return _bedrock_llm
 
-    if _faiss_index is not None and _chunks is not None:
-        return
-
-    s3 = get_s3()
-
-    # Download chunks
-    chunks_path = "/tmp/chunks.json"
-    if not Path(chunks_path).exists():
-        s3.download_file(BUCKET_NAME, CHUNKS_KEY, chunks_path)
 
-    with open(chunks_path) as f:
-        _chunks = json.load(f)
+def get_dynamodb():
+    global _dynamodb
+    if _dynamodb is None:
+        _dynamodb = boto3.client("dynamodb", config=_aws_config)
+    return _dynamodb
 
-    # Download FAISS index (stored as raw float32 vectors + metadata)
-    index_path = "/tmp/permits.index"
-    if not Path(index_path).exists():
-        s3.download_file(BUCKET_NAME, INDEX_KEY, index_path)
 
-    # Load our simple vector index (no faiss dependency needed for small datasets)
-    with open(index_path, "rb") as f:
-        data = f.read()
-
-    # Format: 4 bytes num_vectors, 4 bytes dimensions, then float32 vectors
-    num_vectors = struct.unpack("I", data[:4])[0]
-    dimensions = struct.unpack("I", data[4:8])[0]
+def load_index():
+    """Load FAISS index and chunks from S3 into module globals.
 
-    vectors = []
-    offset = 8
-    for i in range(num_vectors):
-        vec = struct.unpack(f"{dimensions}f", data[offset : offset + dimensions * 4])
-        vectors.append(vec)
-        offset += dimensions * 4
+    Objects are read straight from the get_object body, with no /tmp copy.
+    Warm invocations return immediately and do no I/O.
+    """
+    global _faiss_index, _chunks_texts, _chunks_meta
 
-    _faiss_index = {"vectors": vectors, "dimensions": dimensions}
-    print(f"Loaded {num_vectors} vectors with {dimensions} dimensions")
+    if _faiss_index is not None and _chunks_texts is not None:
+        return
 
+    s3 = get_s3()
 
-def cosine_similarity(a, b):
-    """Compute cosine similarity between two vectors."""
-    dot = sum(x * y for x, y in zip(a, b))
-    norm_a = sum(x * x for x in a) ** 0.5
-    norm_b = sum(x * x for x in b) ** 0.5
-    if norm_a == 0 or norm_b == 0:
-        return 0.0
-    return dot / (norm_a * norm_b)
+    # Load chunks: {"texts": [...], "meta": [...]}, parallel to the index rows
+    obj = s3.get_object(Bucket=BUCKET_NAME, Key=CHUNKS_KEY)
+    chunks = orjson.loads(obj["Body"].read())
+    _chunks_texts = chunks["texts"]
+    _chunks_meta = chunks["meta"]
+
+    # Load FAISS index (self-describing header + vectors, see parse_index).
+    # Our simple vector index needs no faiss dependency for small datasets.
+    obj = s3.get_object(Bucket=BUCKET_NAME, Key=INDEX_KEY)
+    data = obj["Body"].read()
+
+    index = parse_index(data)
+    if index["dimensions"] != EMBEDDING_DIMENSIONS:
+        raise ValueError(
+            f"Index was built with {index['dimensions']} dimensions but EMBEDDING_DIMENSIONS is {EMBEDDING_DIMENSIONS}"
+        )
+    if not len(index["matrix"]) == len(_chunks_texts) == len(_chunks_meta):
+        raise ValueError(
+            f"Index has {len(index['matrix'])} vectors but chunks.json has {len(_chunks_texts)} texts "
+            f"and {len(_chunks_meta)} meta entries; rebuild both together"
+        )
+    _faiss_index = index
+    print(f"Loaded {len(_faiss_index['matrix'])} vectors with {_faiss_index['dimensions']} dimensions")
+
+
+def parse_index(data):
+    """Parse the binary vector index into zero-copy NumPy views.
+
+    Format: header <4sBBHII> (magic b"DCPI", version, dtype, flags,
+    num_vectors, dimensions), then for INT8 num_vectors float32 scales,
+    then the [num_vectors, dimensions] vector block (f32, f16 or i8), then
+    with FLAG_SIGN_BITS one packed sign bit per dimension for each vector.
+    """
+    magic, version, dtype, flags, num_vectors, dimensions = struct.unpack_from(INDEX_HEADER, data)
+    if magic != INDEX_MAGIC:
+        raise ValueError("Not a DC Permit Navigator index (bad magic)")
+    if version != INDEX_VERSION:
+        raise ValueError(f"Unsupported index version {version} (expected {INDEX_VERSION})")
+
+    offset = struct.calcsize(INDEX_HEADER)
+    if dtype == DTYPE_F32:
+        scales = None
+        matrix = np.frombuffer(data, dtype=np.float32, offset=offset, count=num_vectors * dimensions)
+    elif dtype == DTYPE_F16:
+        scales = None
+        matrix = np.frombuffer(data, dtype=np.float16, offset=offset, count=num_vectors * dimensions)
+    elif dtype == DTYPE_I8:
+        scales = np.frombuffer(data, dtype=np.float32, offset=offset, count=num_vectors)
+        offset += num_vectors * 4
+        matrix = np.frombuffer(data, dtype=np.int8, offset=offset, count=num_vectors * dimensions)
+    else:
+        raise ValueError(f"Unsupported index dtype {dtype}")
+    matrix = matrix.reshape(num_vectors, dimensions)
+    offset += matrix.nbytes
+
+    bits = None
+    if flags & FLAG_SIGN_BITS:
+        row_bytes = (dimensions + 7) // 8
+        bits = np.frombuffer(data, dtype=np.uint8, offset=offset, count=num_vectors * row_bytes)
+        bits = bits.reshape(num_vectors, row_bytes)
+
+    # search_index scores with a plain dot product, which is only cosine
+    # similarity if every stored vector is unit length
+    if num_vectors:
+        norms = np.linalg.norm(matrix.astype(np.float32), axis=1)
+        tolerance = NORM_TOLERANCE
+        if scales is not None:
+            norms *= scales
+            tolerance = INT8_NORM_TOLERANCE
+        if np.abs(norms - 1.0).max() >= tolerance:
+            raise ValueError("Index vectors are not L2-normalized; rebuild with normalize=True")
+
+    return {"matrix": matrix, "scales": scales, "bits": bits, "dimensions": dimensions}
+
+
+def quantize_int8(vector):
+    """Symmetric per-vector INT8 quantization: returns (int8 values, float32 scale)."""
+    vec = np.asarray(vector, dtype=np.float32)
+    scale = float(np.abs(vec).max()) / 127
+    if scale == 0:
+        return np.zeros(vec.shape, dtype=np.int8), np.float32(1.0)
+    q = np.clip(np.round(vec / scale), -127, 127).astype(np.int8)
+    return q, np.float32(scale)
+
+
+def dot_scores(matrix, q):
+    """Dot product of every row of matrix with q, in one batch call.
+
+    Uses SimSIMD's SIMD kernels when installed, NumPy otherwise. q is int8
+    for an INT8 matrix and float32 otherwise; it is only rounded to float16
+    for SimSIMD's f16 kernel, which needs matching dtypes.
+    """
+    if simsimd is not None:
+        q = q.astype(matrix.dtype, copy=False)
+        return np.asarray(simsimd.cdist(matrix, q[np.newaxis, :], metric="dot"), dtype=np.float32).ravel()
+    if matrix.dtype == np.int8:
+        return matrix.dot(q.astype(np.int32))
+    # float16 rows are promoted against the float32 query
+    return matrix.dot(q)
+
+
+def hamming_candidates(bits, query_vector, count):
+    """Indices of the count rows whose sign bits are closest to the query's."""
+    q_bits = np.packbits(np.asarray(query_vector) > 0)
+    xor = bits ^ q_bits
+    if hasattr(np, "bitwise_count"):  # NumPy 2.0+
+        distances = np.bitwise_count(xor).sum(axis=1, dtype=np.int32)
+    else:
+        distances = np.unpackbits(xor, axis=1).sum(axis=1, dtype=np.int32)
+    return np.argpartition(distances, count - 1)[:count]
 
 
 def search_index(query_vector, top_k=TOP_K):
-    """Search the vector index for most similar chunks."""
+    """Search the vector index for most similar chunks.
+
+    Titan embeddings are requested with normalize=True, so cosine similarity
+    is just the dot product. For an INT8 index the query is quantized like the
+    stored vectors and the integer scores are rescaled per row. Large indexes
+    with sign bits are first narrowed to PREFILTER_FACTOR * top_k candidates
+    by Hamming distance, and only those are reranked.
+    """
     if _faiss_index is None:
         return []
 
-    similarities = []
-    for i, vec in enumerate(_faiss_index["vectors"]):
-        sim = cosine_similarity(query_vector, vec)
-        similarities.append((i, sim))
+    # A dimension mismatch would silently score garbage, so fail fast
+    if len(query_vector) != _faiss_index["dimensions"]:
+        raise ValueError(f"Query has {len(query_vector)} dimensions, index has {_faiss_index['dimensions']}")
+
+    matrix = _faiss_index["matrix"]
+    top_k = min(top_k, len(matrix))
+    if top_k <= 0:
+        return []
+
+    scales = _faiss_index["scales"]
+    bits = _faiss_index["bits"]
+
+    candidates = None
+    if bits is not None and len(matrix) >= PREFILTER_MIN_VECTORS:
+        candidates = hamming_candidates(bits, query_vector, min(PREFILTER_FACTOR * top_k, len(matrix)))
+        matrix = matrix[candidates]
+        if scales is not None:
+            scales = scales[candidates]
+
+    if scales is None:
+        scores = dot_scores(matrix, np.asarray(query_vector, dtype=np.float32))
+    else:
+        q, q_scale = quantize_int8(query_vector)
+        scores = dot_scores(matrix, q) * (scales * q_scale)
 
-    similarities.sort(key=lambda x: x[1], reverse=True)
-    return similarities[:top_k]
+    idx = np.argpartition(scores, -top_k)[-top_k:]
+    idx = idx[np.argsort(-scores[idx])]
+    rows = idx if candidates is None else candidates[idx]
+    return list(zip(rows.tolist(), scores[idx].tolist()))
 
 
 def embed_text(text):
-    """Embed text using Bedrock Titan Embeddings v2."""
+    """Embed text using Bedrock Titan Embeddings v2, as a float32 vector."""
     bedrock = get_bedrock()
 
     response = bedrock.invoke_model(
         modelId=EMBEDDING_MODEL,
         contentType="application/json",
         accept="application/json",
-        body=json.dumps({"inputText": text, "dimensions": 256, "normalize": True}),
+        body=_EMBED_PREFIX + orjson.dumps(text) + _EMBED_SUFFIX,
     )
 
-    result = json.loads(response["body"].read())
-    return result["embedding"]
+    result = orjson.loads(response["body"].read())
+    return np.asarray(result["embedding"], dtype=np.float32)
 
 
 def generate_answer(question, context_chunks):
     """Generate answer using Bedrock Claude Haiku."""
-    bedrock = get_bedrock()
+    bedrock = get_bedrock_llm()
 
     # Build context from retrieved chunks
     context = "\n\n---\n\n".join(context_chunks)
 
-    prompt = f"""You are the DC Permit Navigator, a helpful assistant that answers questions about Washington DC government permits, licenses, and certifications.
-
-You have access to a database of 103+ DC permits across 16 agencies. Use ONLY the provided context to answer questions. If the context doesn't contain enough information to fully answer the question, say so and suggest which agency to contact.
-
-Rules:
-- Be specific: include permit names, agencies, fees, requirements, and application URLs when available
-- If multiple permits might be needed, list all of them
-- Always mention the issuing agency by full name
-- Include direct links to apply when available
-- If you're not sure, say so — don't guess about government requirements
-- Be concise but thorough
-- Format your response with markdown for readability
-
-Context from permit database:
+    prompt = f"""Context from permit database:
 {context}
 
 User question: {question}"""
@@ -161,22 +356,46 @@ User question: {question}"""
         modelId=LLM_MODEL,
         contentType="application/json",
         accept="application/json",
-        body=json.dumps(
-            {
-                "anthropic_version": "bedrock-2023-05-31",
-                "max_tokens": 1024,
-                "messages": [{"role": "user", "content": prompt}],
-                "temperature": 0.2,
-            }
-        ),
+        body=_LLM_PREFIX + orjson.dumps(prompt) + _LLM_SUFFIX,
     )
 
-    result = json.loads(response["body"].read())
+    result = orjson.loads(response["body"].read())
     return result["content"][0]["text"]
 
 
 def check_rate_limit():
-    """Simple daily rate limiter using a file in /tmp."""
+    """Global daily rate limiter using an atomic DynamoDB counter.
+
+    The increment is conditional on the count being below the cap, so
+    rejected queries are not counted.
+    """
+    if not COUNTER_TABLE:
+        return check_local_rate_limit()
+
+    dynamodb = get_dynamodb()
+    today = time.strftime("%Y-%m-%d")
+
+    try:
+        dynamodb.update_item(
+            TableName=COUNTER_TABLE,
+            Key={"date": {"S": today}},
+            UpdateExpression="ADD #c :one SET expires_at = :ttl",
+            ConditionExpression="attribute_not_exists(#c) OR #c < :max",
+            ExpressionAttributeNames={"#c": "count"},
+            ExpressionAttributeValues={
+                ":one": {"N": "1"},
+                ":max": {"N": str(MAX_DAILY_QUERIES)},
+                ":ttl": {"N": str(int(time.time()) + COUNTER_TTL_SECONDS)},
+            },
+        )
+    except dynamodb.exceptions.ConditionalCheckFailedException:
+        return False
+
+    return True
+
+
+def check_local_rate_limit():
+    """Simple daily rate limiter using a file in /tmp (per container)."""
     today = time.strftime("%Y-%m-%d")
 
     try:
@@ -231,6 +450,13 @@ def lambda_handler(event, context):
         if len(question) > 500:
             return cors_response(400, {"error": "Question too long (max 500 characters)"})
 
+        # Lone surrogates (e.g. "\ud800") are valid JSON escapes but not
+        # encodable text; orjson rejects them when building Bedrock bodies
+        try:
+            question.encode("utf-8")
+        except UnicodeEncodeError:
+            return cors_response(400, {"error": "Question contains invalid characters"})
+
         # Rate limit check
         if not check_rate_limit():
             return cors_response(
@@ -241,7 +467,7 @@ def lambda_handler(event, context):
                 },
             )
 
-        # Load index (cached after first invocation)
+        # Load index (no-op if already loaded at init or by an earlier invocation)
         load_index()
 
         # Embed the question
@@ -253,19 +479,22 @@ def lambda_handler(event, context):
         # Get the text of matching chunks
         context_chunks = []
         source_permits = []
+        seen_ids = set()
+        # Index rows and chunks are checked to line up in load_index
         for idx, score in results:
-            if idx < len(_chunks):
-                chunk = _chunks[idx]
-                context_chunks.append(chunk["text"])
-                if chunk.get("permit_id") not in [s.get("permit_id") for s in source_permits]:
-                    source_permits.append(
-                        {
-                            "permit_id": chunk.get("permit_id"),
-                            "permit_name": chunk.get("permit_name"),
-                            "agency": chunk.get("agency"),
-                            "score": round(score, 3),
-                        }
-                    )
+            context_chunks.append(_chunks_texts[idx])
+            chunk = _chunks_meta[idx]
+            permit_id = chunk.get("permit_id")
+            if permit_id not in seen_ids:
+                seen_ids.add(permit_id)
+                source_permits.append(
+                    {
+                        "permit_id": permit_id,
+                        "permit_name": chunk.get("permit_name"),
+                        "agency": chunk.get("agency"),
+                        "score": round(score, 3),
+                    }
+                )
 
         # Generate answer
         answer = generate_answer(question, context_chunks)
@@ -288,3 +517,20 @@ def lambda_handler(event, context):
                 "detail": str(e),
             },
         )
+
+
+# With EAGER_INIT=1 (set in template.yaml) create clients and load the index
+# during the Lambda INIT phase, which provisioned concurrency and SnapStart
+# cover, so the first request doesn't pay for the S3 download. Locally
+# everything is still created lazily on first use. A failed load is retried
+# by the handler.
+if os.environ.get("EAGER_INIT") == "1":
+    get_s3()
+    get_bedrock()
+    get_bedrock_llm()
+    if COUNTER_TABLE:
+        get_dynamodb()
+    try:
+        load_index()
+    except Exception:
+        traceback.print_exc()
@@ -4,14 +4,15 @@ Build FAISS-compatible vector index from the DC permit database.
 
 Reads data/permits.json, chunks each permit into semantic documents,
 embeds them via Bedrock Titan Embeddings v2, and writes:
-  - data/embeddings/permits.index (binary vector index)
-  - data/embeddings/chunks.json (chunk text + metadata)
+  - data/embeddings/permits.index (binary vector index, FP16 by default)
+  - data/embeddings/chunks.json (chunk texts + parallel metadata list)
 
 Run locally before deployment. One-time cost: ~$0.01 for 103 permits.
 
 Usage:
     python scripts/build_index.py
     python scripts/build_index.py --upload BUCKET_NAME
+    python scripts/build_index.py --dtype i8
 """
 
 import argparse
@@ -19,15 +20,30 @@ import json
 import os
 import struct
 import sys
-import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import boto3
+import numpy as np
+from botocore.config import Config
 
 # Titan Embeddings v2 config
 EMBEDDING_MODEL = "amazon.titan-embed-text-v2:0"
-EMBEDDING_DIMENSIONS = 256  # smallest option, plenty for ~100 docs
-BATCH_DELAY = 0.1  # seconds between API calls to be polite
+# Must match the Lambda's EMBEDDING_DIMENSIONS (template.yaml); 256 is the
+# smallest option, plenty for ~100 docs
+EMBEDDING_DIMENSIONS = int(os.environ.get("EMBEDDING_DIMENSIONS", "256"))
+EMBED_WORKERS = 8  # concurrent Bedrock calls; adaptive retries back off on throttling
+
+# Binary index header, must match lambda/handler.py
+INDEX_HEADER = "<4sBBHII"  # magic, version, dtype, flags, num_vectors, dimensions
+INDEX_MAGIC = b"DCPI"
+INDEX_VERSION = 1
+DTYPE_F32 = 0
+DTYPE_I8 = 1
+DTYPE_F16 = 2
+FLAG_SIGN_BITS = 1  # header flag: packed sign-bit block follows the vectors
+PREFILTER_MIN_VECTORS = 10_000  # below this the handler never reads sign bits
+INDEX_DTYPES = ("f16", "i8", "f32")  # f16 halves the bytes at no practical recall cost
 
 
 def load_permits(permits_path="data/permits.json"):
@@ -108,10 +124,73 @@ def embed_text(bedrock, text):
         ),
     )
     result = json.loads(response["body"].read())
-    return result["embedding"]
+    embedding = result["embedding"]
+    if len(embedding) != EMBEDDING_DIMENSIONS:
+        raise ValueError(f"Expected {EMBEDDING_DIMENSIONS}-dim embedding, got {len(embedding)}")
+    return embedding
 
 
-def build_index(permits_path="data/permits.json", output_dir="data/embeddings"):
+def quantize_int8(vector):
+    """Symmetric per-vector INT8 quantization: returns (int8 values, float32 scale)."""
+    vec = np.asarray(vector, dtype=np.float32)
+    scale = float(np.abs(vec).max()) / 127
+    if scale == 0:
+        return np.zeros(vec.shape, dtype=np.int8), np.float32(1.0)
+    q = np.clip(np.round(vec / scale), -127, 127).astype(np.int8)
+    return q, np.float32(scale)
+
+
+def write_index(index_path, vectors, index_dtype="f16"):
+    """
+    Write the binary vector index.
+
+    Format: header <4sBBHII> (magic, version, dtype, flags, num_vectors,
+    dimensions), then for i8 num_vectors float32 scales, then the vectors
+    as float32, float16 or int8, then for indexes of PREFILTER_MIN_VECTORS
+    or more one packed sign bit per dimension for each vector (the
+    binary-quantized prefilter). Smaller indexes leave it out, since the
+    handler searches them exactly and the block would only add bytes.
+    """
+    matrix = np.asarray(vectors, dtype=np.float32).reshape(len(vectors), EMBEDDING_DIMENSIONS)
+
+    blocks = []
+    if index_dtype == "f32":
+        dtype_code = DTYPE_F32
+        blocks.append(matrix.tobytes())
+    elif index_dtype == "f16":
+        dtype_code = DTYPE_F16
+        blocks.append(matrix.astype(np.float16).tobytes())
+    elif index_dtype == "i8":
+        dtype_code = DTYPE_I8
+        quantized = [quantize_int8(vec) for vec in matrix]
+        scales = np.array([s for _, s in quantized], dtype=np.float32)
+        blocks.append(scales.tobytes())
+        blocks.append(np.array([q for q, _ in quantized], dtype=np.int8).reshape(matrix.shape).tobytes())
+    else:
+        raise ValueError(f"Unsupported index dtype {index_dtype!r}")
+
+    flags = 0
+    if len(vectors) >= PREFILTER_MIN_VECTORS:
+        flags |= FLAG_SIGN_BITS
+        blocks.append(np.packbits(matrix > 0, axis=1).tobytes())
+
+    with open(index_path, "wb") as f:
+        f.write(
+            struct.pack(
+                INDEX_HEADER,
+                INDEX_MAGIC,
+                INDEX_VERSION,
+                dtype_code,
+                flags,
+                len(vectors),
+                EMBEDDING_DIMENSIONS,
+            )
+        )
+        for block in blocks:
+            f.write(block)
+
+
+def build_index(permits_path="data/permits.json", output_dir="data/embeddings", index_dtype="f16"):
     """Build the vector index from the permit database."""
     print(f"Loading permits from {permits_path}...")
     permits, agencies = load_permits(permits_path)
@@ -127,16 +206,20 @@ def build_index(permits_path="data/permits.json", output_dir="data/embeddings"):
 
     # Embed all chunks
     print(f"Embedding {len(all_chunks)} chunks via Bedrock Titan v2...")
-    bedrock = boto3.client("bedrock-runtime")
+    # boto3 clients are thread-safe, so one client is shared by all workers
+    bedrock = boto3.client(
+        "bedrock-runtime",
+        config=Config(retries={"max_attempts": 10, "mode": "adaptive"}),
+    )
 
     vectors = []
-    for i, chunk in enumerate(all_chunks):
-        if i > 0 and i % 10 == 0:
-            print(f"  Embedded {i}/{len(all_chunks)}...")
-
-        vec = embed_text(bedrock, chunk["text"])
-        vectors.append(vec)
-        time.sleep(BATCH_DELAY)
+    with ThreadPoolExecutor(max_workers=EMBED_WORKERS) as executor:
+        # executor.map yields results in input order
+        results = executor.map(lambda c: embed_text(bedrock, c["text"]), all_chunks)
+        for i, vec in enumerate(results):
+            if i > 0 and i % 10 == 0:
+                print(f"  Embedded {i}/{len(all_chunks)}...")
+            vectors.append(vec)
 
     print(f"  Embedded {len(all_chunks)}/{len(all_chunks)} - Done!")
 
@@ -145,21 +228,21 @@ def build_index(permits_path="data/permits.json", output_dir="data/embeddings"):
     output_path.mkdir(parents=True, exist_ok=True)
 
     # Save binary vector index
-    # Format: 4 bytes num_vectors, 4 bytes dimensions, then float32 vectors
     index_path = output_path / "permits.index"
-    with open(index_path, "wb") as f:
-        f.write(struct.pack("I", len(vectors)))
-        f.write(struct.pack("I", EMBEDDING_DIMENSIONS))
-        for vec in vectors:
-            f.write(struct.pack(f"{EMBEDDING_DIMENSIONS}f", *vec))
+    write_index(index_path, vectors, index_dtype)
 
     index_size = index_path.stat().st_size
     print(f"Saved index: {index_path} ({index_size:,} bytes)")
 
     # Save chunks JSON (text + metadata, no vectors)
+    # Stored column-wise: texts[i] and meta[i] describe index row i
     chunks_path = output_path / "chunks.json"
+    chunks_data = {
+        "texts": [c["text"] for c in all_chunks],
+        "meta": [{k: v for k, v in c.items() if k != "text"} for c in all_chunks],
+    }
     with open(chunks_path, "w") as f:
-        json.dump(all_chunks, f, indent=2)
+        json.dump(chunks_data, f, indent=2)
 
     chunks_size = chunks_path.stat().st_size
     print(f"Saved chunks: {chunks_path} ({chunks_size:,} bytes)")
@@ -170,6 +253,7 @@ def build_index(permits_path="data/permits.json", output_dir="data/embeddings"):
     print(f"\nEstimated embedding cost: ~${cost:.4f}")
     print(f"Total chunks: {len(all_chunks)}")
     print(f"Vector dimensions: {EMBEDDING_DIMENSIONS}")
+    print(f"Index dtype: {index_dtype}")
 
     return index_path, chunks_path
 
@@ -203,10 +287,11 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Build vector index for DC Permit Navigator")
     parser.add_argument("--permits", default="data/permits.json", help="Path to permits.json")
     parser.add_argument("--output", default="data/embeddings", help="Output directory")
+    parser.add_argument("--dtype", choices=INDEX_DTYPES, default="f16", help="Vector storage type (default: f16)")
     parser.add_argument("--upload", metavar="BUCKET", help="Upload to S3 bucket after building")
     args = parser.parse_args()
 
-    index_path, chunks_path = build_index(args.permits, args.output)
+    index_path, chunks_path = build_index(args.permits, args.output, args.dtype)
 
     if args.upload:
         upload_to_s3(args.upload, index_path, chunks_path)
@@ -6,29 +6,41 @@ This embeds the permit database directly into the frontend so the
 directory page works without any API calls. Run after any changes
 to permits.json.
 
+Also writes a gzip-compressed copy (permits-data.js.gz) that
+upload-site.sh serves with Content-Encoding: gzip.
+
 Usage:
     python scripts/generate_site_data.py
 """
 
-import json
+import gzip
 from pathlib import Path
 
+import orjson
+
 
 def main():
     permits_path = Path("data/permits.json")
     output_path = Path("site/js/permits-data.js")
 
-    with open(permits_path) as f:
-        data = json.load(f)
+    with open(permits_path, "rb") as f:
+        data = orjson.loads(f.read())
 
-    # Write as a JS global variable
-    js_content = f"// Auto-generated from data/permits.json — do not edit directly\nwindow.PERMITS_DATA = {json.dumps(data, indent=2)};\n"
+    # Write as a JS global variable (compact JSON, no indentation)
+    payload = orjson.dumps(data).decode("utf-8")
+    js_content = f"// Auto-generated from data/permits.json — do not edit directly\nwindow.PERMITS_DATA = {payload};\n"
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(js_content)
+
+    # Pre-compressed copy for the static host
+    gz_path = Path(f"{output_path}.gz")
+    with gzip.open(gz_path, "wt", encoding="utf-8", compresslevel=9) as f:
         f.write(js_content)
 
     print(f"Generated {output_path} ({len(data['permits'])} permits, {output_path.stat().st_size:,} bytes)")
+    print(f"Generated {gz_path} ({gz_path.stat().st_size:,} bytes)")
 
 
 if __name__ == "__main__":
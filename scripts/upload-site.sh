@@ -29,13 +29,24 @@ python3 scripts/generate_site_data.py
 aws s3 sync site/ "s3://$BUCKET/" \
     --delete \
     --cache-control "public, max-age=3600" \
-    --exclude "*.map"
+    --exclude "*.map" \
+    --exclude "*.gz" \
+    --exclude "js/permits-data.js"
 
 # Set longer cache for static assets
 aws s3 sync site/css/ "s3://$BUCKET/css/" \
     --cache-control "public, max-age=86400"
 aws s3 sync site/js/ "s3://$BUCKET/js/" \
-    --cache-control "public, max-age=86400"
+    --cache-control "public, max-age=86400" \
+    --exclude "*.gz" \
+    --exclude "permits-data.js"
+
+# Serve the pre-compressed permit data in place of the plain file (excluded
+# from the syncs above, so --delete leaves this object alone)
+aws s3 cp site/js/permits-data.js.gz "s3://$BUCKET/js/permits-data.js" \
+    --cache-control "public, max-age=86400" \
+    --content-type "application/javascript" \
+    --content-encoding "gzip"
 
 # Set short cache for HTML
 aws s3 cp "s3://$BUCKET/index.html" "s3://$BUCKET/index.html" \
@@ -1,1362 +1,2 @@
 // Auto-generated from data/permits.json — do not edit directly
-window.PERMITS_DATA = {
-  "metadata": {
-    "version": "1.0.0",
-    "last_updated": "2026-02-08",
-    "source": "Manual compilation from dc.gov and agency websites",
-    "total_permits": 103,
-    "notes": "Comprehensive database of DC permits, licenses, and certifications that the public can apply for"
-  },
-  "agencies": [
-    {
-      "id": "dob",
-      "name": "Department of Buildings",
-      "formerly": "DCRA (Department of Consumer and Regulatory Affairs)",
-      "url": "https://dob.dc.gov",
-      "portal": "https://permitwizard.dcra.dc.gov/"
-    },
-    {
-      "id": "dlcp",
-      "name": "Department of Licensing and Consumer Protection",
-      "url": "https://dlcp.dc.gov",
-      "portal": "https://govservices.dcra.dc.gov/oplanewlicense"
-    },
-    {
-      "id": "ddot",
-      "name": "District Department of Transportation",
-      "url": "https://ddot.dc.gov",
-      "portal": "https://tops.ddot.dc.gov/"
-    },
-    {
-      "id": "abca",
-      "name": "Alcoholic Beverage and Cannabis Administration",
-      "formerly": "ABRA (Alcoholic Beverage Regulation Administration)",
-      "url": "https://abca.dc.gov"
-    },
-    {
-      "id": "doh",
-      "name": "DC Health (Department of Health)",
-      "url": "https://dchealth.dc.gov"
-    },
-    {
-      "id": "doee",
-      "name": "Department of Energy and Environment",
-      "formerly": "DDOE",
-      "url": "https://doee.dc.gov"
-    },
-    {
-      "id": "fems",
-      "name": "Fire and Emergency Medical Services Department",
-      "url": "https://fems.dc.gov"
-    },
-    {
-      "id": "mpdc",
-      "name": "Metropolitan Police Department",
-      "url": "https://mpdc.dc.gov"
-    },
-    {
-      "id": "dmv",
-      "name": "Department of Motor Vehicles",
-      "url": "https://dmv.dc.gov"
-    },
-    {
-      "id": "dpr",
-      "name": "Department of Parks and Recreation",
-      "url": "https://dpr.dc.gov"
-    },
-    {
-      "id": "op",
-      "name": "Office of Planning / Historic Preservation Office",
-      "url": "https://planning.dc.gov"
-    },
-    {
-      "id": "dcoz",
-      "name": "Office of Zoning",
-      "url": "https://dcoz.dc.gov"
-    },
-    {
-      "id": "hsema",
-      "name": "Homeland Security and Emergency Management Agency",
-      "url": "https://hsema.dc.gov"
-    },
-    {
-      "id": "film",
-      "name": "Office of Cable Television, Film, Music and Entertainment",
-      "url": "https://film.dc.gov"
-    },
-    {
-      "id": "courts",
-      "name": "DC Superior Court",
-      "url": "https://www.dccourts.gov"
-    },
-    {
-      "id": "glbt",
-      "name": "Mayor's Office of LGBTQ Affairs",
-      "url": "https://glbt.dc.gov"
-    }
-  ],
-  "permits": [
-    {
-      "id": "bldg-001",
-      "name": "Residential Building Permit (1-2 Family)",
-      "category": "Building & Construction",
-      "agency": "dob",
-      "description": "Required for construction, additions, major alterations, and renovations to one- and two-family residential properties. Covers structural work, layout changes, and major home improvements.",
-      "apply_url": "https://permitwizard.dcra.dc.gov/",
-      "how_to_apply": "Use the DOB Permit Wizard online application for residential 1-2 family projects.",
-      "requirements": "Construction documents, proof of ownership or authorization, contractor license (if applicable), may require DCRA plan review.",
-      "fees": "Varies by project scope; see DOB fee schedule",
-      "processing_time": "Varies; Accelerated Plan Review (APR) available for qualifying projects",
-      "related_permits": [
-        "bldg-006",
-        "env-001",
-        "hist-001"
-      ]
-    },
-    {
-      "id": "bldg-002",
-      "name": "Commercial Building Permit",
-      "category": "Building & Construction",
-      "agency": "dob",
-      "description": "Required for commercial construction, tenant fit-outs, and renovations to commercial properties. Includes new developments, additions, and major alterations.",
-      "apply_url": "https://citizenaccess.dcra.dc.gov/",
-      "how_to_apply": "Apply through the Citizen Access Portal for commercial projects.",
-      "requirements": "Detailed construction documents, engineering plans, zoning compliance review, may need multi-agency review.",
-      "fees": "Varies by project scope and square footage",
-      "processing_time": "Typically 30-90 days depending on complexity",
-      "related_permits": [
-        "bldg-003",
-        "bldg-004",
-        "bldg-005"
-      ]
-    },
-    {
-      "id": "bldg-003",
-      "name": "Electrical Permit",
-      "category": "Building & Construction",
-      "agency": "dob",
-      "description": "Required for electrical installations, modifications, or repairs beyond simple fixture replacements. A trade/specialty permit.",
-      "apply_url": "https://citizenaccess.dcra.dc.gov/",
-      "how_to_apply": "Apply through DOB Citizen Access Portal as a supplemental/trade permit.",
-      "requirements": "Licensed electrician required, electrical plans for major work.",
-      "fees": "Varies by scope",
-      "processing_time": "Typically faster than full building permits"
-    },
-    {
-      "id": "bldg-004",
-      "name": "Plumbing Permit",
-      "category": "Building & Construction",
-      "agency": "dob",
-      "description": "Required for plumbing installations, modifications, or new connections. A trade/specialty permit.",
-      "apply_url": "https://citizenaccess.dcra.dc.gov/",
-      "how_to_apply": "Apply through DOB Citizen Access Portal.",
-      "requirements": "Licensed plumber required.",
-      "fees": "Varies by scope",
-      "processing_time": "Typically faster than full building permits"
-    },
-    {
-      "id": "bldg-005",
-      "name": "Mechanical/HVAC Permit",
-      "category": "Building & Construction",
-      "agency": "dob",
-      "description": "Required for heating, ventilation, air conditioning, and gas installations or modifications. A trade/specialty permit.",
-      "apply_url": "https://citizenaccess.dcra.dc.gov/",
-      "how_to_apply": "Apply through DOB Citizen Access Portal.",
-      "requirements": "Licensed mechanical contractor required.",
-      "fees": "Varies by scope",
-      "processing_time": "Typically faster than full building permits"
-    },
-    {
-      "id": "bldg-006",
-      "name": "Solar Panel Permit",
-      "category": "Building & Construction",
-      "agency": "dob",
-      "description": "Required for installation of solar panels on residential or commercial properties.",
-      "apply_url": "https://citizenaccess.dcra.dc.gov/",
-      "how_to_apply": "Apply through DOB Citizen Access Portal. Streamlined process available for standard residential solar.",
-      "requirements": "System design plans, structural analysis, electrical diagrams.",
-      "fees": "Reduced fees for residential solar installations",
-      "processing_time": "Expedited review available for standard residential solar"
-    },
-    {
-      "id": "bldg-007",
-      "name": "Demolition/Raze Permit",
-      "category": "Building & Construction",
-      "agency": "dob",
-      "description": "Required to demolish or raze an existing structure. Subject to additional review if in a historic district.",
-      "apply_url": "https://citizenaccess.dcra.dc.gov/",
-      "how_to_apply": "Apply through DOB Citizen Access Portal. Historic properties require additional HPO review.",
-      "requirements": "Raze application, environmental assessment (asbestos/lead), utility disconnection documentation.",
-      "fees": "Varies",
-      "processing_time": "30-90 days; longer for historic properties",
-      "related_permits": [
-        "env-004",
-        "env-005",
-        "hist-001"
-      ]
-    },
-    {
-      "id": "bldg-008",
-      "name": "Certificate of Occupancy (C of O)",
-      "category": "Building & Construction",
-      "agency": "dob",
-      "description": "Certifies that a building or structure is safe to inhabit and complies with zoning regulations, DC construction codes, and the Green Building Act. Required before occupying a new or significantly altered building.",
-      "apply_url": "https://citizenaccess.dcra.dc.gov/",
-      "how_to_apply": "Apply after construction is complete and all inspections pass.",
-      "requirements": "Final building inspection approval, fire inspection, zoning compliance.",
-      "fees": "Varies",
-      "processing_time": "Depends on inspection scheduling"
-    },
-    {
-      "id": "bldg-009",
-      "name": "Pop-Up Permit (PUP)",
-      "category": "Building & Construction",
-      "agency": "dob",
-      "description": "Streamlined Certificate of Occupancy for temporary use of a previously vacant building for up to one year, without going through the traditional permitting process.",
-      "apply_url": "https://dob.dc.gov",
-      "how_to_apply": "Contact DOB for PUP application process.",
-      "requirements": "Building must be previously vacant, temporary use plan.",
-      "fees": "Reduced compared to standard C of O",
-      "processing_time": "Faster than traditional permitting"
-    },
-    {
-      "id": "bldg-010",
-      "name": "After-Hours Construction Permit",
-      "category": "Building & Construction",
-      "agency": "dob",
-      "description": "Required for construction work outside of normal permitted hours (typically before 7am or after 7pm on weekdays, and weekends/holidays).",
-      "apply_url": "https://citizenaccess.dcra.dc.gov/",
-      "how_to_apply": "Apply through DOB Citizen Access Portal.",
-      "requirements": "Valid building permit, justification for after-hours work.",
-      "fees": "Additional fee on top of standard building permit",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "bldg-011",
-      "name": "Antenna/Satellite Dish Permit",
-      "category": "Building & Construction",
-      "agency": "dob",
-      "description": "Required for installation of telecommunications antennas or satellite dishes on buildings.",
-      "apply_url": "https://citizenaccess.dcra.dc.gov/",
-      "how_to_apply": "Apply through DOB Citizen Access Portal.",
-      "requirements": "Structural analysis, RF emissions compliance.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "bldg-012",
-      "name": "Boiler Permit",
-      "category": "Building & Construction",
-      "agency": "dob",
-      "description": "Required for installation or replacement of boilers in buildings.",
-      "apply_url": "https://citizenaccess.dcra.dc.gov/",
-      "how_to_apply": "Apply through DOB Citizen Access Portal as a specialty permit.",
-      "requirements": "Licensed contractor, equipment specifications.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "bldg-013",
-      "name": "Elevator Permit",
-      "category": "Building & Construction",
-      "agency": "dob",
-      "description": "Required for installation, modification, or major repair of elevators, escalators, and similar conveyances.",
-      "apply_url": "https://citizenaccess.dcra.dc.gov/",
-      "how_to_apply": "Apply through DOB Citizen Access Portal as a specialty permit.",
-      "requirements": "Licensed elevator contractor, engineering plans.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "bldg-014",
-      "name": "Fence Permit",
-      "category": "Building & Construction",
-      "agency": "dob",
-      "description": "Required for installation of fences. Fences in public space also require a DDOT public space permit.",
-      "apply_url": "https://dob.dc.gov",
-      "how_to_apply": "Apply through DOB for private property; DDOT TOPS for public space.",
-      "requirements": "Site plan showing fence location and height.",
-      "fees": "$50-$135",
-      "processing_time": "Varies",
-      "related_permits": [
-        "ps-001"
-      ]
-    },
-    {
-      "id": "bldg-015",
-      "name": "Retaining Wall Permit",
-      "category": "Building & Construction",
-      "agency": "dob",
-      "description": "Required for construction of retaining walls over 4 feet from bottom of footing to top of wall.",
-      "apply_url": "https://dob.dc.gov",
-      "how_to_apply": "Apply through DOB; public space walls also need DDOT permit.",
-      "requirements": "Engineering plans for walls over 4 feet, site plan.",
-      "fees": "$50-$135",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "ps-001",
-      "name": "Public Space Occupancy Permit",
-      "category": "Public Space & Transportation",
-      "agency": "ddot",
-      "description": "Required for any use or occupancy of public space including sidewalks, alleys, roadways, and curb lanes. Covers dumpsters, construction staging, scaffolding, and temporary structures.",
-      "apply_url": "https://tops.ddot.dc.gov/",
-      "how_to_apply": "Apply online through DDOT's Transportation Online Permitting System (TOPS).",
-      "requirements": "TOPS account, site plan, liability insurance. All submissions must be electronic.",
-      "fees": "Varies by type and duration; surface permits issued for 30 days",
-      "processing_time": "Varies by type"
-    },
-    {
-      "id": "ps-002",
-      "name": "Public Space Excavation Permit",
-      "category": "Public Space & Transportation",
-      "agency": "ddot",
-      "description": "Required for any excavation work in public space, including utility connections, pipe repairs, and underground work.",
-      "apply_url": "https://tops.ddot.dc.gov/",
-      "how_to_apply": "Apply online through TOPS.",
-      "requirements": "TOPS account, excavation plans, utility mark-out (Miss Utility).",
-      "fees": "Varies; excavation permits issued for 45 days",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "ps-003",
-      "name": "Sidewalk Cafe Permit",
-      "category": "Public Space & Transportation",
-      "agency": "ddot",
-      "description": "Required for restaurants to operate outdoor dining on public sidewalk space. Also requires a Certificate of Use (COU) from DOB.",
-      "apply_url": "https://tops.ddot.dc.gov/",
-      "how_to_apply": "Apply through TOPS for public space rental, plus DOB for Certificate of Use.",
-      "requirements": "Active DDOT public space rental account, site plan showing table layout, ADA compliance, DOB COU application.",
-      "fees": "Annual public space rental fee varies by location",
-      "processing_time": "Varies",
-      "related_permits": [
-        "bldg-008"
-      ]
-    },
-    {
-      "id": "ps-004",
-      "name": "Driveway/Curb Cut Permit",
-      "category": "Public Space & Transportation",
-      "agency": "ddot",
-      "description": "Required for installing or modifying driveways and curb cuts in public space.",
-      "apply_url": "https://tops.ddot.dc.gov/",
-      "how_to_apply": "Apply through TOPS.",
-      "requirements": "Site plan, engineering drawings.",
-      "fees": "$50-$135",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "ps-005",
-      "name": "Tree Removal/Pruning Permit",
-      "category": "Public Space & Transportation",
-      "agency": "ddot",
-      "description": "Required for planting, pruning, or removing any tree in the public right of way. Must obtain permission from DDOT Urban Forestry Division.",
-      "apply_url": "https://tops.ddot.dc.gov/",
-      "how_to_apply": "Apply through TOPS with Urban Forestry Division approval.",
-      "requirements": "Arborist assessment may be needed, justification for removal.",
-      "fees": "Varies; tree replacement fee may apply for removals",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "ps-006",
-      "name": "Banner/Sign Permit (Public Space)",
-      "category": "Public Space & Transportation",
-      "agency": "ddot",
-      "description": "Required for installing banners, signs, or seasonal displays on DDOT street light poles or other public infrastructure.",
-      "apply_url": "https://tops.ddot.dc.gov/",
-      "how_to_apply": "Apply through TOPS.",
-      "requirements": "Design specifications, location details, duration.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "ps-007",
-      "name": "Valet Parking Permit",
-      "category": "Public Space & Transportation",
-      "agency": "ddot",
-      "description": "Required for businesses providing valet parking using public curb space. Available as Event Venue Valet (occasional) or Standard Valet (regular) permit.",
-      "apply_url": "https://tops.ddot.dc.gov/",
-      "how_to_apply": "Apply through TOPS.",
-      "requirements": "Business license, insurance, designated parking area plan.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "ps-008",
-      "name": "Electric Wiring in Public Space Permit",
-      "category": "Public Space & Transportation",
-      "agency": "ddot",
-      "description": "Required for installing electric wiring or conduit in public space.",
-      "apply_url": "https://tops.ddot.dc.gov/",
-      "how_to_apply": "Apply through TOPS.",
-      "requirements": "Electrical plans, licensed contractor.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "ps-009",
-      "name": "Vault Permit",
-      "category": "Public Space & Transportation",
-      "agency": "ddot",
-      "description": "Required for installation of a vault (underground structure) beneath public space.",
-      "apply_url": "https://tops.ddot.dc.gov/",
-      "how_to_apply": "Apply through TOPS.",
-      "requirements": "Structural engineering plans, site survey.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "ps-010",
-      "name": "Oversized/Overweight Vehicle Permit",
-      "category": "Public Space & Transportation",
-      "agency": "ddot",
-      "description": "Required to operate oversized or overweight vehicles on DC streets. Available as annual tags or single haul permits.",
-      "apply_url": "https://tops.ddot.dc.gov/",
-      "how_to_apply": "Apply through TOPS.",
-      "requirements": "Vehicle specifications, route plan.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "ps-011",
-      "name": "Shared Micromobility Fleet Permit",
-      "category": "Public Space & Transportation",
-      "agency": "ddot",
-      "description": "Required for companies operating shared scooter or bike fleets in DC. Issued for annual terms (e.g., 2025-2026 cycle).",
-      "apply_url": "https://sharedmobility.ddot.dc.gov/pages/2025-2026-permits",
-      "how_to_apply": "Apply during open application period on DDOT shared mobility portal.",
-      "requirements": "Fleet management plan, insurance, compliance with DC regulations.",
-      "fees": "Varies by fleet size",
-      "processing_time": "Annual application cycle"
-    },
-    {
-      "id": "ps-012",
-      "name": "Neighborhood Block Party Permit",
-      "category": "Public Space & Events",
-      "agency": "ddot",
-      "description": "Required for temporary street closures for neighborhood block parties.",
-      "apply_url": "https://ddot.dc.gov/page/neighborhood-block-parties",
-      "how_to_apply": "Apply through HSEMA for street closure, coordinate with DDOT.",
-      "requirements": "Community notification, street closure plan, filed at least 15 business days in advance.",
-      "fees": "Minimal or free",
-      "processing_time": "At least 15 business days"
-    },
-    {
-      "id": "evt-001",
-      "name": "Special Event Permit (Structures)",
-      "category": "Events & Entertainment",
-      "agency": "dob",
-      "description": "Required for special events that include tents, stages, bleachers, generators, or other temporary structures.",
-      "apply_url": "https://dob.dc.gov/specialevents",
-      "how_to_apply": "Submit tent/structure application through DOB Citizen Access Portal.",
-      "requirements": "Tent application, site plan, fire safety plan, structural details.",
-      "fees": "Varies by structure type and size",
-      "processing_time": "Submit well in advance of event"
-    },
-    {
-      "id": "evt-002",
-      "name": "Parade Permit",
-      "category": "Events & Entertainment",
-      "agency": "mpdc",
-      "description": "Required for organizing parades in DC (excluding First Amendment activities). Must not substantially interrupt traffic.",
-      "apply_url": "https://mpdc.dc.gov/node/205572",
-      "how_to_apply": "File completed application with MPD at least 15 business days before the event.",
-      "requirements": "Application, route plan, crowd management plan. Must go through MSETG if street closures needed.",
-      "fees": "Varies",
-      "processing_time": "Minimum 15 business days"
-    },
-    {
-      "id": "evt-003",
-      "name": "Assembly Plan Notification",
-      "category": "Events & Entertainment",
-      "agency": "mpdc",
-      "description": "Required notification for planned assemblies and demonstrations in DC. First Amendment activities are managed by MPD.",
-      "apply_url": "https://mpdc.dc.gov/node/205592",
-      "how_to_apply": "Submit notification to MPD.",
-      "requirements": "Event details, expected attendance, location.",
-      "fees": "None (First Amendment activity)",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "evt-004",
-      "name": "Special Event Street Closure Permit",
-      "category": "Events & Entertainment",
-      "agency": "hsema",
-      "description": "Required for temporary street closures for special events. Must be approved by the Mayor's Special Events Task Group (MSETG).",
-      "apply_url": "https://hsema.dc.gov/service/plan-special-event",
-      "how_to_apply": "Submit Street Closing Information Form to HSEMA. Present event proposal to MSETG (meets 2nd and 4th Monday of each month).",
-      "requirements": "Street closure plan, event proposal, MSETG presentation and concurrence.",
-      "fees": "Varies; Special Event Relief Fund may cover some costs",
-      "processing_time": "Must present to MSETG well before event date"
-    },
-    {
-      "id": "evt-005",
-      "name": "Film Permit",
-      "category": "Events & Entertainment",
-      "agency": "film",
-      "description": "Required for commercial film, television, and photography production on public property in DC.",
-      "apply_url": "https://film.dc.gov/service/apply-film-permit",
-      "how_to_apply": "Apply through DC Film Office.",
-      "requirements": "Production details, location plan, insurance, may need additional public space permits.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "evt-006",
-      "name": "Park Permit / Reservation",
-      "category": "Events & Entertainment",
-      "agency": "dpr",
-      "description": "Required for reserving DC parks, recreation centers, athletic fields, and picnic areas for events or activities.",
-      "apply_url": "https://dpr.dc.gov/service/dpr-permits-and-reservations",
-      "how_to_apply": "Apply through DPR permits and reservations system.",
-      "requirements": "Event details, expected attendance, setup needs.",
-      "fees": "Varies by facility and event type",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "fire-001",
-      "name": "Fire Code Operational Permit",
-      "category": "Fire & Safety",
-      "agency": "fems",
-      "description": "Required for activities regulated by the DC Fire Code including storage of hazardous materials, use of open flames, pyrotechnics, and other fire safety-related operations.",
-      "apply_url": "https://fems.dc.gov/service/operational-permits",
-      "how_to_apply": "Apply through FEMS Fire Prevention Division.",
-      "requirements": "Fire safety plan, inspection may be required.",
-      "fees": "Varies by permit type",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "fire-002",
-      "name": "Fireworks Permit",
-      "category": "Fire & Safety",
-      "agency": "fems",
-      "description": "Required for the display of fireworks in DC. Consumer fireworks are generally prohibited; permit is for professional displays.",
-      "apply_url": "https://fems.dc.gov/service/operational-permits",
-      "how_to_apply": "Apply through FEMS. Professional pyrotechnician required.",
-      "requirements": "Licensed pyrotechnician, safety plan, site plan, insurance.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "fire-003",
-      "name": "Special Event Fire Safety Permit",
-      "category": "Fire & Safety",
-      "agency": "fems",
-      "description": "Required for events with significant occupancy loads. Organizers must notify the Office of the Fire Marshal at least 5 business days before the event.",
-      "apply_url": "https://fems.dc.gov/page/special-events-office-dc-fire-and-ems-department",
-      "how_to_apply": "Submit event notification to Fire Marshal via email or online portal.",
-      "requirements": "Site plan with exits and dimensions, anticipated occupancy, $150 application fee.",
-      "fees": "$150 (covers plan review, approval, and onsite inspection)",
-      "processing_time": "Minimum 5 business days before event"
-    },
-    {
-      "id": "biz-001",
-      "name": "Basic Business License (BBL)",
-      "category": "Business Licenses",
-      "agency": "dlcp",
-      "description": "Required for operating any business in DC. The BBL is the foundational license for all commercial activity in the District.",
-      "apply_url": "https://dlcp.dc.gov",
-      "how_to_apply": "Apply online through DLCP. Certificate of Clean Hands required.",
-      "requirements": "Certificate of Occupancy for business location, Clean Hands certificate, EIN, Articles of Incorporation (if applicable).",
-      "fees": "Varies by business category; biennial renewal",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "biz-002",
-      "name": "Short-Term Rental License",
-      "category": "Business Licenses",
-      "agency": "dlcp",
-      "description": "Required for hosting guests via Airbnb, VRBO, or other short-term rental platforms. Property must be owner's primary residence.",
-      "apply_url": "https://dlcp.dc.gov",
-      "how_to_apply": "Apply through DLCP. Must be primary residence with Homestead Tax Deduction eligibility.",
-      "requirements": "Homestead Deduction documentation, Clean Hands certificate, $250K liability insurance, FR-500 tax registration, HOA permission if applicable.",
-      "fees": "BBL fee applies",
-      "processing_time": "Varies",
-      "notes": "Host must be present for STR (no limit on stays/year); Vacation Rental allows up to 90 nights/year without host present."
-    },
-    {
-      "id": "biz-003",
-      "name": "Vending License",
-      "category": "Business Licenses",
-      "agency": "dlcp",
-      "description": "Required for street vending operations in DC, including food carts, merchandise vendors, and mobile businesses.",
-      "apply_url": "https://dlcp.dc.gov",
-      "how_to_apply": "Apply through DLCP by appointment only.",
-      "requirements": "BBL, health permits (for food), vending site assignment.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "biz-004",
-      "name": "Home Occupation Permit",
-      "category": "Business Licenses",
-      "agency": "dob",
-      "description": "Required for operating a business from your home. The Zoning Administrator reviews HOP applications for compliance with DC Zoning Regulations.",
-      "apply_url": "https://dob.dc.gov",
-      "how_to_apply": "Apply through DOB Zoning Administrator.",
-      "requirements": "BBL, proof of residence, description of home business activity.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "food-001",
-      "name": "Food Service Establishment License",
-      "category": "Food & Health",
-      "agency": "doh",
-      "description": "Primary operating permit for restaurants, cafes, and food service establishments. Required before serving food to the public.",
-      "apply_url": "https://dchealth.dc.gov/service/division-food",
-      "how_to_apply": "Apply online through DC Health Food Division portal. No paper applications accepted.",
-      "requirements": "Kitchen plan review and approval, health inspection, Certified Food Protection Manager on staff, food handler permits for all employees.",
-      "fees": "$280 (under 3,000 sq ft) or $560 (3,000+ sq ft)",
-      "processing_time": "Varies; plan review must be completed before construction"
-    },
-    {
-      "id": "food-002",
-      "name": "Food Handler's Permit",
-      "category": "Food & Health",
-      "agency": "doh",
-      "description": "Required for all employees who handle food in a food service establishment.",
-      "apply_url": "https://dchealth.dc.gov/service/division-food",
-      "how_to_apply": "Complete approved food safety training and apply through DC Health.",
-      "requirements": "Completion of approved food safety training course.",
-      "fees": "$10 per employee",
-      "processing_time": "After training completion"
-    },
-    {
-      "id": "food-003",
-      "name": "Certified Food Protection Manager Certificate",
-      "category": "Food & Health",
-      "agency": "doh",
-      "description": "At least one manager at every food establishment must hold this certification. Must be a certified food protection manager present during all hours of operation.",
-      "apply_url": "https://dchealth.dc.gov/service/division-food",
-      "how_to_apply": "Pass an approved exam (e.g., ServSafe) and obtain DOH-issued Manager ID Card.",
-      "requirements": "Pass approved food safety exam (ServSafe or equivalent), DOH Manager ID Card.",
-      "fees": "~$150 for exam; DOH card fee additional",
-      "processing_time": "After exam completion"
-    },
-    {
-      "id": "food-004",
-      "name": "Mobile Food Vending License (Food Truck)",
-      "category": "Food & Health",
-      "agency": "doh",
-      "description": "Required for operating a food truck or mobile food unit in DC. Requires both health and business licensing.",
-      "apply_url": "https://dchealth.dc.gov/service/division-food",
-      "how_to_apply": "Apply through DC Health for health permit, plus DLCP for vending license.",
-      "requirements": "Vehicle health inspection, commissary agreement, food handler permits, vending license.",
-      "fees": "Varies",
-      "processing_time": "Varies",
-      "related_permits": [
-        "biz-003",
-        "food-001"
-      ]
-    },
-    {
-      "id": "food-005",
-      "name": "Temporary Food Event Permit",
-      "category": "Food & Health",
-      "agency": "doh",
-      "description": "Required for temporary food service at festivals, farmers markets, and special events.",
-      "apply_url": "https://dchealth.dc.gov/service/division-food",
-      "how_to_apply": "Apply through DC Health Food Division.",
-      "requirements": "Event details, food safety plan, temporary setup meeting health standards.",
-      "fees": "Varies",
-      "processing_time": "Apply well in advance of event"
-    },
-    {
-      "id": "alc-001",
-      "name": "On-Premises Alcohol License (Restaurant/Tavern/Nightclub)",
-      "category": "Alcohol & Cannabis",
-      "agency": "abca",
-      "description": "Required for establishments serving alcohol for on-premises consumption. Types include Restaurant, Tavern, Nightclub, Hotel, Club, and Multipurpose. Class C (spirits, wine, beer) or Class D (wine and beer only).",
-      "apply_url": "https://abca.dc.gov/service/alcohol-applications",
-      "how_to_apply": "Apply through ABCA. Attend Alcohol Licensing 101 course recommended for new applicants.",
-      "requirements": "BBL, Certificate of Occupancy, clean criminal record, community notification (ANC), compliance with placement restrictions.",
-      "fees": "Application fee plus annual license fee ($100+)",
-      "processing_time": "60-120 days typical; requires public notice period"
-    },
-    {
-      "id": "alc-002",
-      "name": "Off-Premises Alcohol License (Retail/Liquor Store)",
-      "category": "Alcohol & Cannabis",
-      "agency": "abca",
-      "description": "Required for selling sealed alcoholic beverages for off-premises consumption (liquor stores, grocery stores, convenience stores).",
-      "apply_url": "https://abca.dc.gov/service/alcohol-applications",
-      "how_to_apply": "Apply through ABCA.",
-      "requirements": "BBL, Certificate of Occupancy, clean criminal record, community notification.",
-      "fees": "Application fee plus annual license fee",
-      "processing_time": "60-120 days typical"
-    },
-    {
-      "id": "alc-003",
-      "name": "Internet Alcohol Retailer License",
-      "category": "Alcohol & Cannabis",
-      "agency": "abca",
-      "description": "For retailers selling alcohol online without a physical location open to the public. Class A (spirits, beer, wine) or Class B (beer and wine only).",
-      "apply_url": "https://abca.dc.gov/page/alcohol-internet-retailer-license",
-      "how_to_apply": "Apply through ABCA.",
-      "requirements": "BBL, delivery compliance plan, age verification procedures.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "alc-004",
-      "name": "Manufacturer's Alcohol License",
-      "category": "Alcohol & Cannabis",
-      "agency": "abca",
-      "description": "Required for breweries, wineries, and distilleries. Includes Class A (over 500 barrels/year), Class B (under 500 barrels), and Class C (baked goods with up to 5% ABV).",
-      "apply_url": "https://abca.dc.gov/service/alcohol-applications",
-      "how_to_apply": "Apply through ABCA.",
-      "requirements": "Federal TTB permit, BBL, production facility compliance.",
-      "fees": "Varies by class",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "alc-005",
-      "name": "Festival Alcohol License",
-      "category": "Alcohol & Cannabis",
-      "agency": "abca",
-      "description": "Temporary license permitting sale and consumption of alcohol at approved events for up to 15 days. Can apply every 3 months.",
-      "apply_url": "https://abca.dc.gov/service/alcohol-applications",
-      "how_to_apply": "Apply through ABCA for specific event dates.",
-      "requirements": "Event details, site plan, security plan.",
-      "fees": "Varies",
-      "processing_time": "Apply well in advance"
-    },
-    {
-      "id": "alc-006",
-      "name": "Third-Party Alcohol Delivery License",
-      "category": "Alcohol & Cannabis",
-      "agency": "abca",
-      "description": "Permits same-day delivery of alcohol to consumers by delivery companies on behalf of licensed retailers and manufacturers.",
-      "apply_url": "https://abca.dc.gov/service/alcohol-applications",
-      "how_to_apply": "Apply through ABCA.",
-      "requirements": "Delivery compliance plan, age verification at delivery, insurance.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "alc-007",
-      "name": "Commercial Lifestyle Alcohol License",
-      "category": "Alcohol & Cannabis",
-      "agency": "abca",
-      "description": "Permits on-premises alcohol consumption in common areas of mixed-use commercial developments (walkways, plazas, outdoor areas) purchased from licensed tenants.",
-      "apply_url": "https://abca.dc.gov/service/alcohol-applications",
-      "how_to_apply": "Apply through ABCA.",
-      "requirements": "Mixed-use development, predefined boundary plan, licensed tenant partners.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "can-001",
-      "name": "Medical Cannabis Retailer License",
-      "category": "Alcohol & Cannabis",
-      "agency": "abca",
-      "description": "Permits dispensing medical cannabis and products to eligible patients and caregivers. Also permits manufacturing, purchasing, and selling paraphernalia.",
-      "apply_url": "https://abca.dc.gov/page/medical-cannabis-business-licenses",
-      "how_to_apply": "Apply during open application periods through ABCA (online, in-person, or email). Conditional license available without a location.",
-      "requirements": "21+ years old, DC incorporated for-profit corporation, current on tax filings, not owing DC more than $100, no testing lab interest.",
-      "fees": "$8,000 standard; $2,000 for social equity applicants (first 3 years)",
-      "processing_time": "Varies; applications only accepted during open periods"
-    },
-    {
-      "id": "can-002",
-      "name": "Medical Cannabis Cultivation Center License",
-      "category": "Alcohol & Cannabis",
-      "agency": "abca",
-      "description": "Permits growing cannabis for sale to licensed retailers. No licensee may hold more than 2 cultivation center licenses.",
-      "apply_url": "https://abca.dc.gov/page/medical-cannabis-business-licenses",
-      "how_to_apply": "Apply during open application periods through ABCA.",
-      "requirements": "Same as retailer; plus cultivation facility compliance, security plan.",
-      "fees": "$8,000 standard; $2,000 for social equity applicants",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "can-003",
-      "name": "Medical Cannabis Manufacturer License",
-      "category": "Alcohol & Cannabis",
-      "agency": "abca",
-      "description": "Permits processing, packaging, and labeling of medical cannabis products for sale to licensed retailers and internet retailers.",
-      "apply_url": "https://abca.dc.gov/page/medical-cannabis-business-licenses",
-      "how_to_apply": "Apply during open application periods through ABCA.",
-      "requirements": "Manufacturing facility compliance, product testing requirements.",
-      "fees": "$8,000 standard; $2,000 for social equity applicants",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "can-004",
-      "name": "Medical Cannabis Internet Retailer License",
-      "category": "Alcohol & Cannabis",
-      "agency": "abca",
-      "description": "Permits online sale and delivery of cannabis to eligible patients without a physical storefront open to the public.",
-      "apply_url": "https://abca.dc.gov/page/medical-cannabis-business-licenses",
-      "how_to_apply": "Apply during open application periods through ABCA.",
-      "requirements": "Delivery compliance, age/patient verification, DC incorporation.",
-      "fees": "$8,000 standard; $2,000 for social equity applicants",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "can-005",
-      "name": "Medical Cannabis Testing Laboratory License",
-      "category": "Alcohol & Cannabis",
-      "agency": "abca",
-      "description": "Permits testing of medical cannabis products for safety and potency. Applications accepted on an ongoing basis.",
-      "apply_url": "https://abca.dc.gov/page/medical-cannabis-business-licenses",
-      "how_to_apply": "Apply anytime through ABCA (ongoing acceptance).",
-      "requirements": "Laboratory accreditation, qualified personnel, equipment standards.",
-      "fees": "Varies",
-      "processing_time": "Ongoing acceptance"
-    },
-    {
-      "id": "can-006",
-      "name": "Medical Cannabis Courier License",
-      "category": "Alcohol & Cannabis",
-      "agency": "abca",
-      "description": "Permits delivery of medical cannabis from licensed retailers to patients.",
-      "apply_url": "https://abca.dc.gov/page/medical-cannabis-business-licenses",
-      "how_to_apply": "Apply through ABCA.",
-      "requirements": "DC incorporation, delivery compliance, patient verification.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "env-001",
-      "name": "Erosion and Sediment Control (ESC) Plan Approval",
-      "category": "Environmental",
-      "agency": "doee",
-      "description": "Required for any land-disturbing activity affecting more than 50 square feet. Prevents erosion and sediment pollution in DC waterways.",
-      "apply_url": "https://doee.dc.gov/esc",
-      "how_to_apply": "Submit through DOEE's Surface and Groundwater System (SGS) and DOB's ProjectDox.",
-      "requirements": "ESC plan showing existing topography, proposed changes, control measures, and implementation schedule.",
-      "fees": "Varies",
-      "processing_time": "Varies by project size"
-    },
-    {
-      "id": "env-002",
-      "name": "Stormwater Management Plan (SWMP) Approval",
-      "category": "Environmental",
-      "agency": "doee",
-      "description": "Required for projects disturbing 5,000+ square feet of land. Must demonstrate stormwater retention (1.2 inches for major projects, 0.8 inches for substantial improvements).",
-      "apply_url": "https://doee.dc.gov",
-      "how_to_apply": "Submit through DOEE alongside ESC plan.",
-      "requirements": "Stormwater management design, retention calculations, compliance options (on-site, off-site, in-lieu fee, or SRC purchase).",
-      "fees": "Varies; in-lieu fee option available",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "env-003",
-      "name": "Green Area Ratio (GAR) Plan Approval",
-      "category": "Environmental",
-      "agency": "doee",
-      "description": "Required for new development and renovation projects zoned other than R1-R4. Ensures adequate green/environmental elements in development.",
-      "apply_url": "https://doee.dc.gov",
-      "how_to_apply": "Submit GAR plan through DOEE as part of building permit process.",
-      "requirements": "Landscape plan meeting minimum GAR score for zoning district.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "env-004",
-      "name": "Asbestos Abatement Permit",
-      "category": "Environmental",
-      "agency": "doee",
-      "description": "Required for removal of asbestos-containing materials. Must be obtained by licensed abatement contractors.",
-      "apply_url": "https://doee.dc.gov/service/asbestos-permitting",
-      "how_to_apply": "Submit online through DOEE Asbestos ePermitting System.",
-      "requirements": "Licensed abatement contractor, BBL, Clean Hands certificate, asbestos survey, 10 working day advance notification, building occupant notification 30 days prior.",
-      "fees": "Varies",
-      "processing_time": "Minimum 10 working days advance notification required"
-    },
-    {
-      "id": "env-005",
-      "name": "Lead Renovation/Abatement Permit",
-      "category": "Environmental",
-      "agency": "doee",
-      "description": "Required for renovations or lead-based paint abatements in buildings built before 1978. Individuals and firms must be DOEE-certified.",
-      "apply_url": "https://doee.dc.gov",
-      "how_to_apply": "Apply through DOEE Lead & Healthy Housing Division.",
-      "requirements": "DOEE certification for lead work, EPA RRP Rule compliance for residential/child-occupied facilities.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "env-006",
-      "name": "Underground Storage Tank (UST) Permit",
-      "category": "Environmental",
-      "agency": "doee",
-      "description": "Required for installation, operation, and removal of underground storage tanks containing petroleum products.",
-      "apply_url": "https://doee.dc.gov/es/service/ust-documents-permits-and-certification",
-      "how_to_apply": "Apply through DOEE UST/LUST Branch.",
-      "requirements": "Tank specifications, installation plans, monitoring plan, financial assurance.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "env-007",
-      "name": "Air Quality Permit",
-      "category": "Environmental",
-      "agency": "doee",
-      "description": "Required for new and existing sources of air pollution. The Permitting Branch reviews applications to ensure compliance with air quality standards.",
-      "apply_url": "https://doee.dc.gov",
-      "how_to_apply": "Apply through DOEE Air Quality Division.",
-      "requirements": "Emission calculations, equipment specifications, compliance demonstration.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "env-008",
-      "name": "Fishing License",
-      "category": "Environmental",
-      "agency": "doee",
-      "description": "Required for recreational fishing in DC waters.",
-      "apply_url": "https://doee.dc.gov/service/get-fishing-license",
-      "how_to_apply": "Apply through DOEE.",
-      "requirements": "Valid ID, age requirements.",
-      "fees": "Varies; residents vs non-residents",
-      "processing_time": "Immediate"
-    },
-    {
-      "id": "hist-001",
-      "name": "Historic Preservation Review (Building Permit for Historic Property)",
-      "category": "Historic Preservation",
-      "agency": "op",
-      "description": "Required when a building permit involves work affecting the exterior of a historic property or designated interior. Not a separate application \u2014 it's an additional review step in the normal building permit process. Over 95% are handled through expedited HPO staff review.",
-      "apply_url": "https://planning.dc.gov/page/building-permits-historic-property",
-      "how_to_apply": "File building permit as normal; HPO reviews automatically. Contact HPO first for preliminary consultation. Email: historic.preservation@dc.gov",
-      "requirements": "Building permit application, photos of existing conditions, proposed design drawings. May need HPRB review for major projects.",
-      "fees": "No additional fee beyond building permit",
-      "processing_time": "Most handled through expedited HPO review; HPRB meets monthly (except August)"
-    },
-    {
-      "id": "hist-002",
-      "name": "HPRB Concept Review",
-      "category": "Historic Preservation",
-      "agency": "op",
-      "description": "Optional early-stage review by the Historic Preservation Review Board for major projects on historic properties. Allows design feedback before investing in detailed construction documents.",
-      "apply_url": "https://planning.dc.gov/page/apply-historic-preservation-review-board-concept-review",
-      "how_to_apply": "Email completed application form and materials to historic.preservation@dc.gov by filing deadline.",
-      "requirements": "Concept drawings, project description. Contact HPO staff before filing.",
-      "fees": "No fee",
-      "processing_time": "Scheduled at next available HPRB meeting (monthly)"
-    },
-    {
-      "id": "zone-001",
-      "name": "Zoning Variance",
-      "category": "Zoning",
-      "agency": "dcoz",
-      "description": "Allows a property owner to deviate from strict zoning requirements when strict application would cause exceptional practical difficulties or undue hardship. Heard by the Board of Zoning Adjustment (BZA).",
-      "apply_url": "https://dcoz.dc.gov/page/variance",
-      "how_to_apply": "Complete BZA Form-135 with architect or DC-barred attorney. File with Office of Zoning.",
-      "requirements": "Demonstration of exceptional hardship, no substantial detriment to public good, consistency with zoning intent. ANC notification required.",
-      "fees": "Filing fee varies",
-      "processing_time": "Several months (BZA hearing schedule)"
-    },
-    {
-      "id": "zone-002",
-      "name": "Special Exception",
-      "category": "Zoning",
-      "agency": "dcoz",
-      "description": "Permission to use property in a way that is allowed by the Zoning Regulations but requires BZA approval due to potential impacts on neighbors.",
-      "apply_url": "https://dcoz.dc.gov/page/variancespecial-exception",
-      "how_to_apply": "File application with BZA through Office of Zoning.",
-      "requirements": "Meets specific criteria in Zoning Regulations, ANC notification.",
-      "fees": "Filing fee varies",
-      "processing_time": "Several months"
-    },
-    {
-      "id": "prof-001",
-      "name": "Barber License",
-      "category": "Professional & Occupational Licenses",
-      "agency": "dlcp",
-      "description": "Required for practicing barbering in DC. Types include Operator, Manager, Owner, and Instructor. Expires September 30th of odd-numbered years.",
-      "apply_url": "https://govservices.dcra.dc.gov/oplanewlicense",
-      "how_to_apply": "Apply through DLCP occupational licensing portal. Access DC account required.",
-      "requirements": "Exam completion, training hours, 6 CE credits for renewal (2 health/safety + 4 general).",
-      "fees": "Varies by license type",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "prof-002",
-      "name": "Cosmetology License",
-      "category": "Professional & Occupational Licenses",
-      "agency": "dlcp",
-      "description": "Required for practicing cosmetology, esthetics, braiding, electrolysis, or manicuring in DC. Types include Operator, Manager, Owner, and Instructor. Expires April 15th of even-numbered years.",
-      "apply_url": "https://govservices.dcra.dc.gov/oplanewlicense",
-      "how_to_apply": "Apply through DLCP occupational licensing portal.",
-      "requirements": "Exam completion, training hours, 6 CE credits for renewal.",
-      "fees": "Varies by license type",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "prof-003",
-      "name": "Body Art License (Tattoo/Piercing/Micropigmentation)",
-      "category": "Professional & Occupational Licenses",
-      "agency": "dlcp",
-      "description": "Required for tattoo artists, body piercers, and micropigmentation practitioners. Types include Operator and Manager.",
-      "apply_url": "https://govservices.dcra.dc.gov/oplanewlicense",
-      "how_to_apply": "Apply through DLCP.",
-      "requirements": "Training, bloodborne pathogens certification.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "prof-004",
-      "name": "Architect License",
-      "category": "Professional & Occupational Licenses",
-      "agency": "dlcp",
-      "description": "Required for practicing architecture in DC. Overseen by the Board of Architecture, Interior Design & Landscape Architects.",
-      "apply_url": "https://govservices.dcra.dc.gov/oplanewlicense",
-      "how_to_apply": "Apply through DLCP.",
-      "requirements": "NCARB certification, exam passage, education requirements.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "prof-005",
-      "name": "Professional Engineer License",
-      "category": "Professional & Occupational Licenses",
-      "agency": "dlcp",
-      "description": "Required for practicing professional engineering in DC.",
-      "apply_url": "https://govservices.dcra.dc.gov/oplanewlicense",
-      "how_to_apply": "Apply through DLCP Professional Engineer Board.",
-      "requirements": "PE exam, education, experience requirements.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "prof-006",
-      "name": "Real Estate License",
-      "category": "Professional & Occupational Licenses",
-      "agency": "dlcp",
-      "description": "Required for real estate agents, brokers, and property managers in DC. Overseen by the Real Estate Commission.",
-      "apply_url": "https://govservices.dcra.dc.gov/oplanewlicense",
-      "how_to_apply": "Apply through DLCP.",
-      "requirements": "Pre-license education, exam, background check.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "prof-007",
-      "name": "Real Estate Appraiser License",
-      "category": "Professional & Occupational Licenses",
-      "agency": "dlcp",
-      "description": "Required for performing real estate appraisals in DC.",
-      "apply_url": "https://govservices.dcra.dc.gov/oplanewlicense",
-      "how_to_apply": "Apply through DLCP.",
-      "requirements": "Appraisal education, exam, supervised experience.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "prof-008",
-      "name": "Security Guard License",
-      "category": "Professional & Occupational Licenses",
-      "agency": "dlcp",
-      "description": "Required for security officers and security agencies operating in DC.",
-      "apply_url": "https://govservices.dcra.dc.gov/oplanewlicense",
-      "how_to_apply": "Apply through DLCP Security program.",
-      "requirements": "Training, background check.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "prof-009",
-      "name": "Tour Guide License",
-      "category": "Professional & Occupational Licenses",
-      "agency": "dlcp",
-      "description": "Required for professional tour guides operating in DC.",
-      "apply_url": "https://govservices.dcra.dc.gov/oplanewlicense",
-      "how_to_apply": "Apply through DLCP Tour Guide program.",
-      "requirements": "Application, knowledge requirements.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "prof-010",
-      "name": "Funeral Director License",
-      "category": "Professional & Occupational Licenses",
-      "agency": "dlcp",
-      "description": "Required for funeral directors operating in DC.",
-      "apply_url": "https://govservices.dcra.dc.gov/oplanewlicense",
-      "how_to_apply": "Apply through DLCP.",
-      "requirements": "Education, examination, apprenticeship.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "prof-011",
-      "name": "Interior Design License",
-      "category": "Professional & Occupational Licenses",
-      "agency": "dlcp",
-      "description": "Required for practicing commercial interior design in DC.",
-      "apply_url": "https://govservices.dcra.dc.gov/oplanewlicense",
-      "how_to_apply": "Apply through DLCP.",
-      "requirements": "NCIDQ certification, education, experience.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "prof-012",
-      "name": "Athlete Agent License",
-      "category": "Professional & Occupational Licenses",
-      "agency": "dlcp",
-      "description": "Required for athlete agents representing athletes in DC.",
-      "apply_url": "https://govservices.dcra.dc.gov/oplanewlicense",
-      "how_to_apply": "Apply through DLCP Athlete Agent Program.",
-      "requirements": "Application, disclosure of background.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "prof-013",
-      "name": "Combat Sports License",
-      "category": "Professional & Occupational Licenses",
-      "agency": "dlcp",
-      "description": "Required for combat sports promoters, fighters, referees, and other participants in DC.",
-      "apply_url": "https://govservices.dcra.dc.gov/oplanewlicense",
-      "how_to_apply": "Apply through DLCP Combat Sports program.",
-      "requirements": "Varies by role (promoter, fighter, referee, etc.).",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "health-001",
-      "name": "Health Professional License",
-      "category": "Health Professions",
-      "agency": "doh",
-      "description": "Required for physicians, nurses, dentists, pharmacists, psychologists, social workers, and other health professionals practicing in DC. Over 30 health profession categories.",
-      "apply_url": "https://dchealth.dc.gov/service/health-professionals",
-      "how_to_apply": "Apply through DC Health Board of respective profession.",
-      "requirements": "Varies by profession: education, exam, supervised practice, background check.",
-      "fees": "Varies by profession",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "animal-001",
-      "name": "Dog License",
-      "category": "Animal Permits",
-      "agency": "doh",
-      "description": "Required for all dogs in DC. Must be licensed within specified period after acquisition or moving to DC.",
-      "apply_url": "https://dchealth.dc.gov/node/164952",
-      "how_to_apply": "Apply through DC Health.",
-      "requirements": "Proof of rabies vaccination.",
-      "fees": "Varies (spayed/neutered vs intact)",
-      "processing_time": "Immediate"
-    },
-    {
-      "id": "animal-002",
-      "name": "Animal Hobby Permit",
-      "category": "Animal Permits",
-      "agency": "doh",
-      "description": "Required for keeping certain animals as a hobby (e.g., chickens, bees) in residential areas.",
-      "apply_url": "https://dchealth.dc.gov/node/164972",
-      "how_to_apply": "Apply through DC Health.",
-      "requirements": "Property details, animal housing plan, neighbor notification may be required.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "animal-003",
-      "name": "Exotic Animal Permit",
-      "category": "Animal Permits",
-      "agency": "doh",
-      "description": "Required for keeping exotic animals in DC. Many exotic species are prohibited.",
-      "apply_url": "https://dchealth.dc.gov/node/165112",
-      "how_to_apply": "Apply through DC Health.",
-      "requirements": "Species identification, housing plan, safety measures.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "animal-004",
-      "name": "Pigeon Coop Permit",
-      "category": "Animal Permits",
-      "agency": "doh",
-      "description": "Required for keeping pigeons in DC.",
-      "apply_url": "https://dchealth.dc.gov/node/165032",
-      "how_to_apply": "Apply through DC Health.",
-      "requirements": "Coop specifications, location details.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "animal-005",
-      "name": "Animal Disease Prevention Permit",
-      "category": "Animal Permits",
-      "agency": "doh",
-      "description": "Required for activities related to animal disease prevention and control in DC.",
-      "apply_url": "https://dchealth.dc.gov/node/165002",
-      "how_to_apply": "Apply through DC Health.",
-      "requirements": "Varies by activity.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "parking-001",
-      "name": "Residential Parking Permit (RPP)",
-      "category": "Parking & Driving",
-      "agency": "dmv",
-      "description": "Allows DC residents to park in their designated Residential Permit Parking zone without time restrictions.",
-      "apply_url": "https://dmv.dc.gov/node/156542",
-      "how_to_apply": "Apply through DC DMV online, by mail, or in person.",
-      "requirements": "DC vehicle registration, proof of residency in RPP zone.",
-      "fees": "$35/year",
-      "processing_time": "Immediate at DMV; 7-10 days by mail"
-    },
-    {
-      "id": "parking-002",
-      "name": "Visitor Parking Permit",
-      "category": "Parking & Driving",
-      "agency": "dmv",
-      "description": "Allows guests of DC residents to park in RPP zones. Limited number per household per year.",
-      "apply_url": "https://dmv.dc.gov/node/156592",
-      "how_to_apply": "Apply through DC DMV.",
-      "requirements": "DC resident with valid RPP, guest vehicle information.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "parking-003",
-      "name": "Healthcare Provider Temporary Parking Permit",
-      "category": "Parking & Driving",
-      "agency": "dmv",
-      "description": "Allows healthcare providers making house calls to park in RPP zones.",
-      "apply_url": "https://dmv.dc.gov/node/156572",
-      "how_to_apply": "Apply through DC DMV.",
-      "requirements": "Healthcare provider credentials, proof of house call services.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "parking-004",
-      "name": "Contractual Employee Temporary Parking Permit",
-      "category": "Parking & Driving",
-      "agency": "dmv",
-      "description": "Allows contractors working on a job in an RPP zone to park there temporarily.",
-      "apply_url": "https://dmv.dc.gov/node/156602",
-      "how_to_apply": "Apply through DC DMV.",
-      "requirements": "Proof of contract work at address in RPP zone.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "driving-001",
-      "name": "Learner's Permit",
-      "category": "Parking & Driving",
-      "agency": "dmv",
-      "description": "Required first step before obtaining a DC driver's license. Allows supervised driving.",
-      "apply_url": "https://dmv.dc.gov/service/learner-permit",
-      "how_to_apply": "Apply at DC DMV service center.",
-      "requirements": "Knowledge test, vision test, identity documents, Social Security number.",
-      "fees": "$47",
-      "processing_time": "Same day (pass knowledge test)"
-    },
-    {
-      "id": "driving-002",
-      "name": "Driver's License",
-      "category": "Parking & Driving",
-      "agency": "dmv",
-      "description": "Standard DC driver's license for operating a motor vehicle.",
-      "apply_url": "https://dmv.dc.gov/service/driver-licenses",
-      "how_to_apply": "Apply at DC DMV after holding learner's permit for required period.",
-      "requirements": "Learner's permit, road skills test, identity documents.",
-      "fees": "$47 (8-year license)",
-      "processing_time": "Same day (pass road test)"
-    },
-    {
-      "id": "driving-003",
-      "name": "Commercial Driver's License (CDL)",
-      "category": "Parking & Driving",
-      "agency": "dmv",
-      "description": "Required for operating commercial vehicles (buses, trucks, hazmat) in DC.",
-      "apply_url": "https://dmv.dc.gov/service/obtain-commercial-driver-license",
-      "how_to_apply": "Apply at DC DMV.",
-      "requirements": "CDL knowledge test, CDL skills test, medical certificate, background check (some endorsements).",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "driving-004",
-      "name": "Trip Permit (Buses)",
-      "category": "Parking & Driving",
-      "agency": "dmv",
-      "description": "Required for operating charter or commercial buses on DC roads for specific trips.",
-      "apply_url": "https://dmv.dc.gov/service/obtain-trip-permit",
-      "how_to_apply": "Apply through DC DMV.",
-      "requirements": "Vehicle information, trip details, insurance.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "firearm-001",
-      "name": "Firearms Registration",
-      "category": "Firearms",
-      "agency": "mpdc",
-      "description": "Required for all firearms possessed in DC. DC requires registration of every firearm.",
-      "apply_url": "https://mpdc.dc.gov/service/firearm-registration-district-columbia",
-      "how_to_apply": "Apply through MPD Firearms Registration Section.",
-      "requirements": "Background check, firearms training, vision test, ballistics test for handguns.",
-      "fees": "$13 per firearm",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "vital-001",
-      "name": "Marriage License",
-      "category": "Vital Records",
-      "agency": "courts",
-      "description": "Required to legally marry in DC. No waiting period, no blood test required.",
-      "apply_url": "https://www.dccourts.gov",
-      "how_to_apply": "Apply at DC Superior Court Marriage Bureau. Both parties must appear in person.",
-      "requirements": "Valid government-issued photo ID, Social Security numbers, $35 fee.",
-      "fees": "$35",
-      "processing_time": "Same day"
-    },
-    {
-      "id": "vital-002",
-      "name": "Domestic Partnership Registration",
-      "category": "Vital Records",
-      "agency": "glbt",
-      "description": "Register a domestic partnership in DC.",
-      "apply_url": "https://glbt.dc.gov/page/dc-domestic-partnerships",
-      "how_to_apply": "Apply through Mayor's Office of LGBTQ Affairs.",
-      "requirements": "Both partners must appear, valid ID, meet DC requirements.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "vital-003",
-      "name": "Birth Certificate Request",
-      "category": "Vital Records",
-      "agency": "doh",
-      "description": "Request a certified copy of a DC birth certificate.",
-      "apply_url": "https://dchealth.dc.gov/service/birth-certificates",
-      "how_to_apply": "Apply online or in person through DC Health Vital Records Division.",
-      "requirements": "Valid ID, relationship to person on certificate.",
-      "fees": "$23 per copy",
-      "processing_time": "Varies by method"
-    },
-    {
-      "id": "vital-004",
-      "name": "Death Certificate Request",
-      "category": "Vital Records",
-      "agency": "doh",
-      "description": "Request a certified copy of a DC death certificate.",
-      "apply_url": "https://dchealth.dc.gov/service/death-certificates",
-      "how_to_apply": "Apply through DC Health Vital Records Division.",
-      "requirements": "Valid ID, relationship to decedent or legal authorization.",
-      "fees": "$18 per copy",
-      "processing_time": "Varies"
-    },
-    {
-      "id": "food-006",
-      "name": "Retail Food License",
-      "category": "Food & Health",
-      "agency": "dlcp",
-      "description": "Required for retail food establishments including grocery stores, convenience stores, and specialty food shops.",
-      "apply_url": "https://dlcp.dc.gov",
-      "how_to_apply": "Apply through DLCP as part of BBL.",
-      "requirements": "Health inspection, food safety compliance, BBL.",
-      "fees": "Varies",
-      "processing_time": "Varies"
-    }
-  ]
-};
+window.PERMITS_DATA = {"metadata":{"version":"1.0.0","last_updated":"2026-02-08","source":"Manual compilation from dc.gov and agency websites","total_permits":103,"notes":"Comprehensive database of DC permits, licenses, and certifications that the public can apply for"},"agencies":[{"id":"dob","name":"Department of Buildings","formerly":"DCRA (Department of Consumer and Regulatory Affairs)","url":"https://dob.dc.gov","portal":"https://permitwizard.dcra.dc.gov/"},{"id":"dlcp","name":"Department of Licensing and Consumer Protection","url":"https://dlcp.dc.gov","portal":"https://govservices.dcra.dc.gov/oplanewlicense"},{"id":"ddot","name":"District Department of Transportation","url":"https://ddot.dc.gov","portal":"https://tops.ddot.dc.gov/"},{"id":"abca","name":"Alcoholic Beverage and Cannabis Administration","formerly":"ABRA (Alcoholic Beverage Regulation Administration)","url":"https://abca.dc.gov"},{"id":"doh","name":"DC Health (Department of Health)","url":"https://dchealth.dc.gov"},{"id":"doee","name":"Department of Energy and Environment","formerly":"DDOE","url":"https://doee.dc.gov"},{"id":"fems","name":"Fire and Emergency Medical Services Department","url":"https://fems.dc.gov"},{"id":"mpdc","name":"Metropolitan Police Department","url":"https://mpdc.dc.gov"},{"id":"dmv","name":"Department of Motor Vehicles","url":"https://dmv.dc.gov"},{"id":"dpr","name":"Department of Parks and Recreation","url":"https://dpr.dc.gov"},{"id":"op","name":"Office of Planning / Historic Preservation Office","url":"https://planning.dc.gov"},{"id":"dcoz","name":"Office of Zoning","url":"https://dcoz.dc.gov"},{"id":"hsema","name":"Homeland Security and Emergency Management Agency","url":"https://hsema.dc.gov"},{"id":"film","name":"Office of Cable Television, Film, Music and Entertainment","url":"https://film.dc.gov"},{"id":"courts","name":"DC Superior Court","url":"https://www.dccourts.gov"},{"id":"glbt","name":"Mayor's Office of LGBTQ Affairs","url":"https://glbt.dc.gov"}],"permits":[{"id":"bldg-001","name":"Residential Building Permit (1-2 Family)","category":"Building & Construction","agency":"dob","description":"Required for construction, additions, major alterations, and renovations to one- and two-family residential properties. Covers structural work, layout changes, and major home improvements.","apply_url":"https://permitwizard.dcra.dc.gov/","how_to_apply":"Use the DOB Permit Wizard online application for residential 1-2 family projects.","requirements":"Construction documents, proof of ownership or authorization, contractor license (if applicable), may require DCRA plan review.","fees":"Varies by project scope; see DOB fee schedule","processing_time":"Varies; Accelerated Plan Review (APR) available for qualifying projects","related_permits":["bldg-006","env-001","hist-001"]},{"id":"bldg-002","name":"Commercial Building Permit","category":"Building & Construction","agency":"dob","description":"Required for commercial construction, tenant fit-outs, and renovations to commercial properties. Includes new developments, additions, and major alterations.","apply_url":"https://citizenaccess.dcra.dc.gov/","how_to_apply":"Apply through the Citizen Access Portal for commercial projects.","requirements":"Detailed construction documents, engineering plans, zoning compliance review, may need multi-agency review.","fees":"Varies by project scope and square footage","processing_time":"Typically 30-90 days depending on complexity","related_permits":["bldg-003","bldg-004","bldg-005"]},{"id":"bldg-003","name":"Electrical Permit","category":"Building & Construction","agency":"dob","description":"Required for electrical installations, modifications, or repairs beyond simple fixture replacements. A trade/specialty permit.","apply_url":"https://citizenaccess.dcra.dc.gov/","how_to_apply":"Apply through DOB Citizen Access Portal as a supplemental/trade permit.","requirements":"Licensed electrician required, electrical plans for major work.","fees":"Varies by scope","processing_time":"Typically faster than full building permits"},{"id":"bldg-004","name":"Plumbing Permit","category":"Building & Construction","agency":"dob","description":"Required for plumbing installations, modifications, or new connections. A trade/specialty permit.","apply_url":"https://citizenaccess.dcra.dc.gov/","how_to_apply":"Apply through DOB Citizen Access Portal.","requirements":"Licensed plumber required.","fees":"Varies by scope","processing_time":"Typically faster than full building permits"},{"id":"bldg-005","name":"Mechanical/HVAC Permit","category":"Building & Construction","agency":"dob","description":"Required for heating, ventilation, air conditioning, and gas installations or modifications. A trade/specialty permit.","apply_url":"https://citizenaccess.dcra.dc.gov/","how_to_apply":"Apply through DOB Citizen Access Portal.","requirements":"Licensed mechanical contractor required.","fees":"Varies by scope","processing_time":"Typically faster than full building permits"},{"id":"bldg-006","name":"Solar Panel Permit","category":"Building & Construction","agency":"dob","description":"Required for installation of solar panels on residential or commercial properties.","apply_url":"https://citizenaccess.dcra.dc.gov/","how_to_apply":"Apply through DOB Citizen Access Portal. Streamlined process available for standard residential solar.","requirements":"System design plans, structural analysis, electrical diagrams.","fees":"Reduced fees for residential solar installations","processing_time":"Expedited review available for standard residential solar"},{"id":"bldg-007","name":"Demolition/Raze Permit","category":"Building & Construction","agency":"dob","description":"Required to demolish or raze an existing structure. Subject to additional review if in a historic district.","apply_url":"https://citizenaccess.dcra.dc.gov/","how_to_apply":"Apply through DOB Citizen Access Portal. Historic properties require additional HPO review.","requirements":"Raze application, environmental assessment (asbestos/lead), utility disconnection documentation.","fees":"Varies","processing_time":"30-90 days; longer for historic properties","related_permits":["env-004","env-005","hist-001"]},{"id":"bldg-008","name":"Certificate of Occupancy (C of O)","category":"Building & Construction","agency":"dob","description":"Certifies that a building or structure is safe to inhabit and complies with zoning regulations, DC construction codes, and the Green Building Act. Required before occupying a new or significantly altered building.","apply_url":"https://citizenaccess.dcra.dc.gov/","how_to_apply":"Apply after construction is complete and all inspections pass.","requirements":"Final building inspection approval, fire inspection, zoning compliance.","fees":"Varies","processing_time":"Depends on inspection scheduling"},{"id":"bldg-009","name":"Pop-Up Permit (PUP)","category":"Building & Construction","agency":"dob","description":"Streamlined Certificate of Occupancy for temporary use of a previously vacant building for up to one year, without going through the traditional permitting process.","apply_url":"https://dob.dc.gov","how_to_apply":"Contact DOB for PUP application process.","requirements":"Building must be previously vacant, temporary use plan.","fees":"Reduced compared to standard C of O","processing_time":"Faster than traditional permitting"},{"id":"bldg-010","name":"After-Hours Construction Permit","category":"Building & Construction","agency":"dob","description":"Required for construction work outside of normal permitted hours (typically before 7am or after 7pm on weekdays, and weekends/holidays).","apply_url":"https://citizenaccess.dcra.dc.gov/","how_to_apply":"Apply through DOB Citizen Access Portal.","requirements":"Valid building permit, justification for after-hours work.","fees":"Additional fee on top of standard building permit","processing_time":"Varies"},{"id":"bldg-011","name":"Antenna/Satellite Dish Permit","category":"Building & Construction","agency":"dob","description":"Required for installation of telecommunications antennas or satellite dishes on buildings.","apply_url":"https://citizenaccess.dcra.dc.gov/","how_to_apply":"Apply through DOB Citizen Access Portal.","requirements":"Structural analysis, RF emissions compliance.","fees":"Varies","processing_time":"Varies"},{"id":"bldg-012","name":"Boiler Permit","category":"Building & Construction","agency":"dob","description":"Required for installation or replacement of boilers in buildings.","apply_url":"https://citizenaccess.dcra.dc.gov/","how_to_apply":"Apply through DOB Citizen Access Portal as a specialty permit.","requirements":"Licensed contractor, equipment specifications.","fees":"Varies","processing_time":"Varies"},{"id":"bldg-013","name":"Elevator Permit","category":"Building & Construction","agency":"dob","description":"Required for installation, modification, or major repair of elevators, escalators, and similar conveyances.","apply_url":"https://citizenaccess.dcra.dc.gov/","how_to_apply":"Apply through DOB Citizen Access Portal as a specialty permit.","requirements":"Licensed elevator contractor, engineering plans.","fees":"Varies","processing_time":"Varies"},{"id":"bldg-014","name":"Fence Permit","category":"Building & Construction","agency":"dob","description":"Required for installation of fences. Fences in public space also require a DDOT public space permit.","apply_url":"https://dob.dc.gov","how_to_apply":"Apply through DOB for private property; DDOT TOPS for public space.","requirements":"Site plan showing fence location and height.","fees":"$50-$135","processing_time":"Varies","related_permits":["ps-001"]},{"id":"bldg-015","name":"Retaining Wall Permit","category":"Building & Construction","agency":"dob","description":"Required for construction of retaining walls over 4 feet from bottom of footing to top of wall.","apply_url":"https://dob.dc.gov","how_to_apply":"Apply through DOB; public space walls also need DDOT permit.","requirements":"Engineering plans for walls over 4 feet, site plan.","fees":"$50-$135","processing_time":"Varies"},{"id":"ps-001","name":"Public Space Occupancy Permit","category":"Public Space & Transportation","agency":"ddot","description":"Required for any use or occupancy of public space including sidewalks, alleys, roadways, and curb lanes. Covers dumpsters, construction staging, scaffolding, and temporary structures.","apply_url":"https://tops.ddot.dc.gov/","how_to_apply":"Apply online through DDOT's Transportation Online Permitting System (TOPS).","requirements":"TOPS account, site plan, liability insurance. All submissions must be electronic.","fees":"Varies by type and duration; surface permits issued for 30 days","processing_time":"Varies by type"},{"id":"ps-002","name":"Public Space Excavation Permit","category":"Public Space & Transportation","agency":"ddot","description":"Required for any excavation work in public space, including utility connections, pipe repairs, and underground work.","apply_url":"https://tops.ddot.dc.gov/","how_to_apply":"Apply online through TOPS.","requirements":"TOPS account, excavation plans, utility mark-out (Miss Utility).","fees":"Varies; excavation permits issued for 45 days","processing_time":"Varies"},{"id":"ps-003","name":"Sidewalk Cafe Permit","category":"Public Space & Transportation","agency":"ddot","description":"Required for restaurants to operate outdoor dining on public sidewalk space. Also requires a Certificate of Use (COU) from DOB.","apply_url":"https://tops.ddot.dc.gov/","how_to_apply":"Apply through TOPS for public space rental, plus DOB for Certificate of Use.","requirements":"Active DDOT public space rental account, site plan showing table layout, ADA compliance, DOB COU application.","fees":"Annual public space rental fee varies by location","processing_time":"Varies","related_permits":["bldg-008"]},{"id":"ps-004","name":"Driveway/Curb Cut Permit","category":"Public Space & Transportation","agency":"ddot","description":"Required for installing or modifying driveways and curb cuts in public space.","apply_url":"https://tops.ddot.dc.gov/","how_to_apply":"Apply through TOPS.","requirements":"Site plan, engineering drawings.","fees":"$50-$135","processing_time":"Varies"},{"id":"ps-005","name":"Tree Removal/Pruning Permit","category":"Public Space & Transportation","agency":"ddot","description":"Required for planting, pruning, or removing any tree in the public right of way. Must obtain permission from DDOT Urban Forestry Division.","apply_url":"https://tops.ddot.dc.gov/","how_to_apply":"Apply through TOPS with Urban Forestry Division approval.","requirements":"Arborist assessment may be needed, justification for removal.","fees":"Varies; tree replacement fee may apply for removals","processing_time":"Varies"},{"id":"ps-006","name":"Banner/Sign Permit (Public Space)","category":"Public Space & Transportation","agency":"ddot","description":"Required for installing banners, signs, or seasonal displays on DDOT street light poles or other public infrastructure.","apply_url":"https://tops.ddot.dc.gov/","how_to_apply":"Apply through TOPS.","requirements":"Design specifications, location details, duration.","fees":"Varies","processing_time":"Varies"},{"id":"ps-007","name":"Valet Parking Permit","category":"Public Space & Transportation","agency":"ddot","description":"Required for businesses providing valet parking using public curb space. Available as Event Venue Valet (occasional) or Standard Valet (regular) permit.","apply_url":"https://tops.ddot.dc.gov/","how_to_apply":"Apply through TOPS.","requirements":"Business license, insurance, designated parking area plan.","fees":"Varies","processing_time":"Varies"},{"id":"ps-008","name":"Electric Wiring in Public Space Permit","category":"Public Space & Transportation","agency":"ddot","description":"Required for installing electric wiring or conduit in public space.","apply_url":"https://tops.ddot.dc.gov/","how_to_apply":"Apply through TOPS.","requirements":"Electrical plans, licensed contractor.","fees":"Varies","processing_time":"Varies"},{"id":"ps-009","name":"Vault Permit","category":"Public Space & Transportation","agency":"ddot","description":"Required for installation of a vault (underground structure) beneath public space.","apply_url":"https://tops.ddot.dc.gov/","how_to_apply":"Apply through TOPS.","requirements":"Structural engineering plans, site survey.","fees":"Varies","processing_time":"Varies"},{"id":"ps-010","name":"Oversized/Overweight Vehicle Permit","category":"Public Space & Transportation","agency":"ddot","description":"Required to operate oversized or overweight vehicles on DC streets. Available as annual tags or single haul permits.","apply_url":"https://tops.ddot.dc.gov/","how_to_apply":"Apply through TOPS.","requirements":"Vehicle specifications, route plan.","fees":"Varies","processing_time":"Varies"},{"id":"ps-011","name":"Shared Micromobility Fleet Permit","category":"Public Space & Transportation","agency":"ddot","description":"Required for companies operating shared scooter or bike fleets in DC. Issued for annual terms (e.g., 2025-2026 cycle).","apply_url":"https://sharedmobility.ddot.dc.gov/pages/2025-2026-permits","how_to_apply":"Apply during open application period on DDOT shared mobility portal.","requirements":"Fleet management plan, insurance, compliance with DC regulations.","fees":"Varies by fleet size","processing_time":"Annual application cycle"},{"id":"ps-012","name":"Neighborhood Block Party Permit","category":"Public Space & Events","agency":"ddot","description":"Required for temporary street closures for neighborhood block parties.","apply_url":"https://ddot.dc.gov/page/neighborhood-block-parties","how_to_apply":"Apply through HSEMA for street closure, coordinate with DDOT.","requirements":"Community notification, street closure plan, filed at least 15 business days in advance.","fees":"Minimal or free","processing_time":"At least 15 business days"},{"id":"evt-001","name":"Special Event Permit (Structures)","category":"Events & Entertainment","agency":"dob","description":"Required for special events that include tents, stages, bleachers, generators, or other temporary structures.","apply_url":"https://dob.dc.gov/specialevents","how_to_apply":"Submit tent/structure application through DOB Citizen Access Portal.","requirements":"Tent application, site plan, fire safety plan, structural details.","fees":"Varies by structure type and size","processing_time":"Submit well in advance of event"},{"id":"evt-002","name":"Parade Permit","category":"Events & Entertainment","agency":"mpdc","description":"Required for organizing parades in DC (excluding First Amendment activities). Must not substantially interrupt traffic.","apply_url":"https://mpdc.dc.gov/node/205572","how_to_apply":"File completed application with MPD at least 15 business days before the event.","requirements":"Application, route plan, crowd management plan. Must go through MSETG if street closures needed.","fees":"Varies","processing_time":"Minimum 15 business days"},{"id":"evt-003","name":"Assembly Plan Notification","category":"Events & Entertainment","agency":"mpdc","description":"Required notification for planned assemblies and demonstrations in DC. First Amendment activities are managed by MPD.","apply_url":"https://mpdc.dc.gov/node/205592","how_to_apply":"Submit notification to MPD.","requirements":"Event details, expected attendance, location.","fees":"None (First Amendment activity)","processing_time":"Varies"},{"id":"evt-004","name":"Special Event Street Closure Permit","category":"Events & Entertainment","agency":"hsema","description":"Required for temporary street closures for special events. Must be approved by the Mayor's Special Events Task Group (MSETG).","apply_url":"https://hsema.dc.gov/service/plan-special-event","how_to_apply":"Submit Street Closing Information Form to HSEMA. Present event proposal to MSETG (meets 2nd and 4th Monday of each month).","requirements":"Street closure plan, event proposal, MSETG presentation and concurrence.","fees":"Varies; Special Event Relief Fund may cover some costs","processing_time":"Must present to MSETG well before event date"},{"id":"evt-005","name":"Film Permit","category":"Events & Entertainment","agency":"film","description":"Required for commercial film, television, and photography production on public property in DC.","apply_url":"https://film.dc.gov/service/apply-film-permit","how_to_apply":"Apply through DC Film Office.","requirements":"Production details, location plan, insurance, may need additional public space permits.","fees":"Varies","processing_time":"Varies"},{"id":"evt-006","name":"Park Permit / Reservation","category":"Events & Entertainment","agency":"dpr","description":"Required for reserving DC parks, recreation centers, athletic fields, and picnic areas for events or activities.","apply_url":"https://dpr.dc.gov/service/dpr-permits-and-reservations","how_to_apply":"Apply through DPR permits and reservations system.","requirements":"Event details, expected attendance, setup needs.","fees":"Varies by facility and event type","processing_time":"Varies"},{"id":"fire-001","name":"Fire Code Operational Permit","category":"Fire & Safety","agency":"fems","description":"Required for activities regulated by the DC Fire Code including storage of hazardous materials, use of open flames, pyrotechnics, and other fire safety-related operations.","apply_url":"https://fems.dc.gov/service/operational-permits","how_to_apply":"Apply through FEMS Fire Prevention Division.","requirements":"Fire safety plan, inspection may be required.","fees":"Varies by permit type","processing_time":"Varies"},{"id":"fire-002","name":"Fireworks Permit","category":"Fire & Safety","agency":"fems","description":"Required for the display of fireworks in DC. Consumer fireworks are generally prohibited; permit is for professional displays.","apply_url":"https://fems.dc.gov/service/operational-permits","how_to_apply":"Apply through FEMS. Professional pyrotechnician required.","requirements":"Licensed pyrotechnician, safety plan, site plan, insurance.","fees":"Varies","processing_time":"Varies"},{"id":"fire-003","name":"Special Event Fire Safety Permit","category":"Fire & Safety","agency":"fems","description":"Required for events with significant occupancy loads. Organizers must notify the Office of the Fire Marshal at least 5 business days before the event.","apply_url":"https://fems.dc.gov/page/special-events-office-dc-fire-and-ems-department","how_to_apply":"Submit event notification to Fire Marshal via email or online portal.","requirements":"Site plan with exits and dimensions, anticipated occupancy, $150 application fee.","fees":"$150 (covers plan review, approval, and onsite inspection)","processing_time":"Minimum 5 business days before event"},{"id":"biz-001","name":"Basic Business License (BBL)","category":"Business Licenses","agency":"dlcp","description":"Required for operating any business in DC. The BBL is the foundational license for all commercial activity in the District.","apply_url":"https://dlcp.dc.gov","how_to_apply":"Apply online through DLCP. Certificate of Clean Hands required.","requirements":"Certificate of Occupancy for business location, Clean Hands certificate, EIN, Articles of Incorporation (if applicable).","fees":"Varies by business category; biennial renewal","processing_time":"Varies"},{"id":"biz-002","name":"Short-Term Rental License","category":"Business Licenses","agency":"dlcp","description":"Required for hosting guests via Airbnb, VRBO, or other short-term rental platforms. Property must be owner's primary residence.","apply_url":"https://dlcp.dc.gov","how_to_apply":"Apply through DLCP. Must be primary residence with Homestead Tax Deduction eligibility.","requirements":"Homestead Deduction documentation, Clean Hands certificate, $250K liability insurance, FR-500 tax registration, HOA permission if applicable.","fees":"BBL fee applies","processing_time":"Varies","notes":"Host must be present for STR (no limit on stays/year); Vacation Rental allows up to 90 nights/year without host present."},{"id":"biz-003","name":"Vending License","category":"Business Licenses","agency":"dlcp","description":"Required for street vending operations in DC, including food carts, merchandise vendors, and mobile businesses.","apply_url":"https://dlcp.dc.gov","how_to_apply":"Apply through DLCP by appointment only.","requirements":"BBL, health permits (for food), vending site assignment.","fees":"Varies","processing_time":"Varies"},{"id":"biz-004","name":"Home Occupation Permit","category":"Business Licenses","agency":"dob","description":"Required for operating a business from your home. The Zoning Administrator reviews HOP applications for compliance with DC Zoning Regulations.","apply_url":"https://dob.dc.gov","how_to_apply":"Apply through DOB Zoning Administrator.","requirements":"BBL, proof of residence, description of home business activity.","fees":"Varies","processing_time":"Varies"},{"id":"food-001","name":"Food Service Establishment License","category":"Food & Health","agency":"doh","description":"Primary operating permit for restaurants, cafes, and food service establishments. Required before serving food to the public.","apply_url":"https://dchealth.dc.gov/service/division-food","how_to_apply":"Apply online through DC Health Food Division portal. No paper applications accepted.","requirements":"Kitchen plan review and approval, health inspection, Certified Food Protection Manager on staff, food handler permits for all employees.","fees":"$280 (under 3,000 sq ft) or $560 (3,000+ sq ft)","processing_time":"Varies; plan review must be completed before construction"},{"id":"food-002","name":"Food Handler's Permit","category":"Food & Health","agency":"doh","description":"Required for all employees who handle food in a food service establishment.","apply_url":"https://dchealth.dc.gov/service/division-food","how_to_apply":"Complete approved food safety training and apply through DC Health.","requirements":"Completion of approved food safety training course.","fees":"$10 per employee","processing_time":"After training completion"},{"id":"food-003","name":"Certified Food Protection Manager Certificate","category":"Food & Health","agency":"doh","description":"At least one manager at every food establishment must hold this certification. Must be a certified food protection manager present during all hours of operation.","apply_url":"https://dchealth.dc.gov/service/division-food","how_to_apply":"Pass an approved exam (e.g., ServSafe) and obtain DOH-issued Manager ID Card.","requirements":"Pass approved food safety exam (ServSafe or equivalent), DOH Manager ID Card.","fees":"~$150 for exam; DOH card fee additional","processing_time":"After exam completion"},{"id":"food-004","name":"Mobile Food Vending License (Food Truck)","category":"Food & Health","agency":"doh","description":"Required for operating a food truck or mobile food unit in DC. Requires both health and business licensing.","apply_url":"https://dchealth.dc.gov/service/division-food","how_to_apply":"Apply through DC Health for health permit, plus DLCP for vending license.","requirements":"Vehicle health inspection, commissary agreement, food handler permits, vending license.","fees":"Varies","processing_time":"Varies","related_permits":["biz-003","food-001"]},{"id":"food-005","name":"Temporary Food Event Permit","category":"Food & Health","agency":"doh","description":"Required for temporary food service at festivals, farmers markets, and special events.","apply_url":"https://dchealth.dc.gov/service/division-food","how_to_apply":"Apply through DC Health Food Division.","requirements":"Event details, food safety plan, temporary setup meeting health standards.","fees":"Varies","processing_time":"Apply well in advance of event"},{"id":"alc-001","name":"On-Premises Alcohol License (Restaurant/Tavern/Nightclub)","category":"Alcohol & Cannabis","agency":"abca","description":"Required for establishments serving alcohol for on-premises consumption. Types include Restaurant, Tavern, Nightclub, Hotel, Club, and Multipurpose. Class C (spirits, wine, beer) or Class D (wine and beer only).","apply_url":"https://abca.dc.gov/service/alcohol-applications","how_to_apply":"Apply through ABCA. Attend Alcohol Licensing 101 course recommended for new applicants.","requirements":"BBL, Certificate of Occupancy, clean criminal record, community notification (ANC), compliance with placement restrictions.","fees":"Application fee plus annual license fee ($100+)","processing_time":"60-120 days typical; requires public notice period"},{"id":"alc-002","name":"Off-Premises Alcohol License (Retail/Liquor Store)","category":"Alcohol & Cannabis","agency":"abca","description":"Required for selling sealed alcoholic beverages for off-premises consumption (liquor stores, grocery stores, convenience stores).","apply_url":"https://abca.dc.gov/service/alcohol-applications","how_to_apply":"Apply through ABCA.","requirements":"BBL, Certificate of Occupancy, clean criminal record, community notification.","fees":"Application fee plus annual license fee","processing_time":"60-120 days typical"},{"id":"alc-003","name":"Internet Alcohol Retailer License","category":"Alcohol & Cannabis","agency":"abca","description":"For retailers selling alcohol online without a physical location open to the public. Class A (spirits, beer, wine) or Class B (beer and wine only).","apply_url":"https://abca.dc.gov/page/alcohol-internet-retailer-license","how_to_apply":"Apply through ABCA.","requirements":"BBL, delivery compliance plan, age verification procedures.","fees":"Varies","processing_time":"Varies"},{"id":"alc-004","name":"Manufacturer's Alcohol License","category":"Alcohol & Cannabis","agency":"abca","description":"Required for breweries, wineries, and distilleries. Includes Class A (over 500 barrels/year), Class B (under 500 barrels), and Class C (baked goods with up to 5% ABV).","apply_url":"https://abca.dc.gov/service/alcohol-applications","how_to_apply":"Apply through ABCA.","requirements":"Federal TTB permit, BBL, production facility compliance.","fees":"Varies by class","processing_time":"Varies"},{"id":"alc-005","name":"Festival Alcohol License","category":"Alcohol & Cannabis","agency":"abca","description":"Temporary license permitting sale and consumption of alcohol at approved events for up to 15 days. Can apply every 3 months.","apply_url":"https://abca.dc.gov/service/alcohol-applications","how_to_apply":"Apply through ABCA for specific event dates.","requirements":"Event details, site plan, security plan.","fees":"Varies","processing_time":"Apply well in advance"},{"id":"alc-006","name":"Third-Party Alcohol Delivery License","category":"Alcohol & Cannabis","agency":"abca","description":"Permits same-day delivery of alcohol to consumers by delivery companies on behalf of licensed retailers and manufacturers.","apply_url":"https://abca.dc.gov/service/alcohol-applications","how_to_apply":"Apply through ABCA.","requirements":"Delivery compliance plan, age verification at delivery, insurance.","fees":"Varies","processing_time":"Varies"},{"id":"alc-007","name":"Commercial Lifestyle Alcohol License","category":"Alcohol & Cannabis","agency":"abca","description":"Permits on-premises alcohol consumption in common areas of mixed-use commercial developments (walkways, plazas, outdoor areas) purchased from licensed tenants.","apply_url":"https://abca.dc.gov/service/alcohol-applications","how_to_apply":"Apply through ABCA.","requirements":"Mixed-use development, predefined boundary plan, licensed tenant partners.","fees":"Varies","processing_time":"Varies"},{"id":"can-001","name":"Medical Cannabis Retailer License","category":"Alcohol & Cannabis","agency":"abca","description":"Permits dispensing medical cannabis and products to eligible patients and caregivers. Also permits manufacturing, purchasing, and selling paraphernalia.","apply_url":"https://abca.dc.gov/page/medical-cannabis-business-licenses","how_to_apply":"Apply during open application periods through ABCA (online, in-person, or email). Conditional license available without a location.","requirements":"21+ years old, DC incorporated for-profit corporation, current on tax filings, not owing DC more than $100, no testing lab interest.","fees":"$8,000 standard; $2,000 for social equity applicants (first 3 years)","processing_time":"Varies; applications only accepted during open periods"},{"id":"can-002","name":"Medical Cannabis Cultivation Center License","category":"Alcohol & Cannabis","agency":"abca","description":"Permits growing cannabis for sale to licensed retailers. No licensee may hold more than 2 cultivation center licenses.","apply_url":"https://abca.dc.gov/page/medical-cannabis-business-licenses","how_to_apply":"Apply during open application periods through ABCA.","requirements":"Same as retailer; plus cultivation facility compliance, security plan.","fees":"$8,000 standard; $2,000 for social equity applicants","processing_time":"Varies"},{"id":"can-003","name":"Medical Cannabis Manufacturer License","category":"Alcohol & Cannabis","agency":"abca","description":"Permits processing, packaging, and labeling of medical cannabis products for sale to licensed retailers and internet retailers.","apply_url":"https://abca.dc.gov/page/medical-cannabis-business-licenses","how_to_apply":"Apply during open application periods through ABCA.","requirements":"Manufacturing facility compliance, product testing requirements.","fees":"$8,000 standard; $2,000 for social equity applicants","processing_time":"Varies"},{"id":"can-004","name":"Medical Cannabis Internet Retailer License","category":"Alcohol & Cannabis","agency":"abca","description":"Permits online sale and delivery of cannabis to eligible patients without a physical storefront open to the public.","apply_url":"https://abca.dc.gov/page/medical-cannabis-business-licenses","how_to_apply":"Apply during open application periods through ABCA.","requirements":"Delivery compliance, age/patient verification, DC incorporation.","fees":"$8,000 standard; $2,000 for social equity applicants","processing_time":"Varies"},{"id":"can-005","name":"Medical Cannabis Testing Laboratory License","category":"Alcohol & Cannabis","agency":"abca","description":"Permits testing of medical cannabis products for safety and potency. Applications accepted on an ongoing basis.","apply_url":"https://abca.dc.gov/page/medical-cannabis-business-licenses","how_to_apply":"Apply anytime through ABCA (ongoing acceptance).","requirements":"Laboratory accreditation, qualified personnel, equipment standards.","fees":"Varies","processing_time":"Ongoing acceptance"},{"id":"can-006","name":"Medical Cannabis Courier License","category":"Alcohol & Cannabis","agency":"abca","description":"Permits delivery of medical cannabis from licensed retailers to patients.","apply_url":"https://abca.dc.gov/page/medical-cannabis-business-licenses","how_to_apply":"Apply through ABCA.","requirements":"DC incorporation, delivery compliance, patient verification.","fees":"Varies","processing_time":"Varies"},{"id":"env-001","name":"Erosion and Sediment Control (ESC) Plan Approval","category":"Environmental","agency":"doee","description":"Required for any land-disturbing activity affecting more than 50 square feet. Prevents erosion and sediment pollution in DC waterways.","apply_url":"https://doee.dc.gov/esc","how_to_apply":"Submit through DOEE's Surface and Groundwater System (SGS) and DOB's ProjectDox.","requirements":"ESC plan showing existing topography, proposed changes, control measures, and implementation schedule.","fees":"Varies","processing_time":"Varies by project size"},{"id":"env-002","name":"Stormwater Management Plan (SWMP) Approval","category":"Environmental","agency":"doee","description":"Required for projects disturbing 5,000+ square feet of land. Must demonstrate stormwater retention (1.2 inches for major projects, 0.8 inches for substantial improvements).","apply_url":"https://doee.dc.gov","how_to_apply":"Submit through DOEE alongside ESC plan.","requirements":"Stormwater management design, retention calculations, compliance options (on-site, off-site, in-lieu fee, or SRC purchase).","fees":"Varies; in-lieu fee option available","processing_time":"Varies"},{"id":"env-003","name":"Green Area Ratio (GAR) Plan Approval","category":"Environmental","agency":"doee","description":"Required for new development and renovation projects zoned other than R1-R4. Ensures adequate green/environmental elements in development.","apply_url":"https://doee.dc.gov","how_to_apply":"Submit GAR plan through DOEE as part of building permit process.","requirements":"Landscape plan meeting minimum GAR score for zoning district.","fees":"Varies","processing_time":"Varies"},{"id":"env-004","name":"Asbestos Abatement Permit","category":"Environmental","agency":"doee","description":"Required for removal of asbestos-containing materials. Must be obtained by licensed abatement contractors.","apply_url":"https://doee.dc.gov/service/asbestos-permitting","how_to_apply":"Submit online through DOEE Asbestos ePermitting System.","requirements":"Licensed abatement contractor, BBL, Clean Hands certificate, asbestos survey, 10 working day advance notification, building occupant notification 30 days prior.","fees":"Varies","processing_time":"Minimum 10 working days advance notification required"},{"id":"env-005","name":"Lead Renovation/Abatement Permit","category":"Environmental","agency":"doee","description":"Required for renovations or lead-based paint abatements in buildings built before 1978. Individuals and firms must be DOEE-certified.","apply_url":"https://doee.dc.gov","how_to_apply":"Apply through DOEE Lead & Healthy Housing Division.","requirements":"DOEE certification for lead work, EPA RRP Rule compliance for residential/child-occupied facilities.","fees":"Varies","processing_time":"Varies"},{"id":"env-006","name":"Underground Storage Tank (UST) Permit","category":"Environmental","agency":"doee","description":"Required for installation, operation, and removal of underground storage tanks containing petroleum products.","apply_url":"https://doee.dc.gov/es/service/ust-documents-permits-and-certification","how_to_apply":"Apply through DOEE UST/LUST Branch.","requirements":"Tank specifications, installation plans, monitoring plan, financial assurance.","fees":"Varies","processing_time":"Varies"},{"id":"env-007","name":"Air Quality Permit","category":"Environmental","agency":"doee","description":"Required for new and existing sources of air pollution. The Permitting Branch reviews applications to ensure compliance with air quality standards.","apply_url":"https://doee.dc.gov","how_to_apply":"Apply through DOEE Air Quality Division.","requirements":"Emission calculations, equipment specifications, compliance demonstration.","fees":"Varies","processing_time":"Varies"},{"id":"env-008","name":"Fishing License","category":"Environmental","agency":"doee","description":"Required for recreational fishing in DC waters.","apply_url":"https://doee.dc.gov/service/get-fishing-license","how_to_apply":"Apply through DOEE.","requirements":"Valid ID, age requirements.","fees":"Varies; residents vs non-residents","processing_time":"Immediate"},{"id":"hist-001","name":"Historic Preservation Review (Building Permit for Historic Property)","category":"Historic Preservation","agency":"op","description":"Required when a building permit involves work affecting the exterior of a historic property or designated interior. Not a separate application — it's an additional review step in the normal building permit process. Over 95% are handled through expedited HPO staff review.","apply_url":"https://planning.dc.gov/page/building-permits-historic-property","how_to_apply":"File building permit as normal; HPO reviews automatically. Contact HPO first for preliminary consultation. Email: historic.preservation@dc.gov","requirements":"Building permit application, photos of existing conditions, proposed design drawings. May need HPRB review for major projects.","fees":"No additional fee beyond building permit","processing_time":"Most handled through expedited HPO review; HPRB meets monthly (except August)"},{"id":"hist-002","name":"HPRB Concept Review","category":"Historic Preservation","agency":"op","description":"Optional early-stage review by the Historic Preservation Review Board for major projects on historic properties. Allows design feedback before investing in detailed construction documents.","apply_url":"https://planning.dc.gov/page/apply-historic-preservation-review-board-concept-review","how_to_apply":"Email completed application form and materials to historic.preservation@dc.gov by filing deadline.","requirements":"Concept drawings, project description. Contact HPO staff before filing.","fees":"No fee","processing_time":"Scheduled at next available HPRB meeting (monthly)"},{"id":"zone-001","name":"Zoning Variance","category":"Zoning","agency":"dcoz","description":"Allows a property owner to deviate from strict zoning requirements when strict application would cause exceptional practical difficulties or undue hardship. Heard by the Board of Zoning Adjustment (BZA).","apply_url":"https://dcoz.dc.gov/page/variance","how_to_apply":"Complete BZA Form-135 with architect or DC-barred attorney. File with Office of Zoning.","requirements":"Demonstration of exceptional hardship, no substantial detriment to public good, consistency with zoning intent. ANC notification required.","fees":"Filing fee varies","processing_time":"Several months (BZA hearing schedule)"},{"id":"zone-002","name":"Special Exception","category":"Zoning","agency":"dcoz","description":"Permission to use property in a way that is allowed by the Zoning Regulations but requires BZA approval due to potential impacts on neighbors.","apply_url":"https://dcoz.dc.gov/page/variancespecial-exception","how_to_apply":"File application with BZA through Office of Zoning.","requirements":"Meets specific criteria in Zoning Regulations, ANC notification.","fees":"Filing fee varies","processing_time":"Several months"},{"id":"prof-001","name":"Barber License","category":"Professional & Occupational Licenses","agency":"dlcp","description":"Required for practicing barbering in DC. Types include Operator, Manager, Owner, and Instructor. Expires September 30th of odd-numbered years.","apply_url":"https://govservices.dcra.dc.gov/oplanewlicense","how_to_apply":"Apply through DLCP occupational licensing portal. Access DC account required.","requirements":"Exam completion, training hours, 6 CE credits for renewal (2 health/safety + 4 general).","fees":"Varies by license type","processing_time":"Varies"},{"id":"prof-002","name":"Cosmetology License","category":"Professional & Occupational Licenses","agency":"dlcp","description":"Required for practicing cosmetology, esthetics, braiding, electrolysis, or manicuring in DC. Types include Operator, Manager, Owner, and Instructor. Expires April 15th of even-numbered years.","apply_url":"https://govservices.dcra.dc.gov/oplanewlicense","how_to_apply":"Apply through DLCP occupational licensing portal.","requirements":"Exam completion, training hours, 6 CE credits for renewal.","fees":"Varies by license type","processing_time":"Varies"},{"id":"prof-003","name":"Body Art License (Tattoo/Piercing/Micropigmentation)","category":"Professional & Occupational Licenses","agency":"dlcp","description":"Required for tattoo artists, body piercers, and micropigmentation practitioners. Types include Operator and Manager.","apply_url":"https://govservices.dcra.dc.gov/oplanewlicense","how_to_apply":"Apply through DLCP.","requirements":"Training, bloodborne pathogens certification.","fees":"Varies","processing_time":"Varies"},{"id":"prof-004","name":"Architect License","category":"Professional & Occupational Licenses","agency":"dlcp","description":"Required for practicing architecture in DC. Overseen by the Board of Architecture, Interior Design & Landscape Architects.","apply_url":"https://govservices.dcra.dc.gov/oplanewlicense","how_to_apply":"Apply through DLCP.","requirements":"NCARB certification, exam passage, education requirements.","fees":"Varies","processing_time":"Varies"},{"id":"prof-005","name":"Professional Engineer License","category":"Professional & Occupational Licenses","agency":"dlcp","description":"Required for practicing professional engineering in DC.","apply_url":"https://govservices.dcra.dc.gov/oplanewlicense","how_to_apply":"Apply through DLCP Professional Engineer Board.","requirements":"PE exam, education, experience requirements.","fees":"Varies","processing_time":"Varies"},{"id":"prof-006","name":"Real Estate License","category":"Professional & Occupational Licenses","agency":"dlcp","description":"Required for real estate agents, brokers, and property managers in DC. Overseen by the Real Estate Commission.","apply_url":"https://govservices.dcra.dc.gov/oplanewlicense","how_to_apply":"Apply through DLCP.","requirements":"Pre-license education, exam, background check.","fees":"Varies","processing_time":"Varies"},{"id":"prof-007","name":"Real Estate Appraiser License","category":"Professional & Occupational Licenses","agency":"dlcp","description":"Required for performing real estate appraisals in DC.","apply_url":"https://govservices.dcra.dc.gov/oplanewlicense","how_to_apply":"Apply through DLCP.","requirements":"Appraisal education, exam, supervised experience.","fees":"Varies","processing_time":"Varies"},{"id":"prof-008","name":"Security Guard License","category":"Professional & Occupational Licenses","agency":"dlcp","description":"Required for security officers and security agencies operating in DC.","apply_url":"https://govservices.dcra.dc.gov/oplanewlicense","how_to_apply":"Apply through DLCP Security program.","requirements":"Training, background check.","fees":"Varies","processing_time":"Varies"},{"id":"prof-009","name":"Tour Guide License","category":"Professional & Occupational Licenses","agency":"dlcp","description":"Required for professional tour guides operating in DC.","apply_url":"https://govservices.dcra.dc.gov/oplanewlicense","how_to_apply":"Apply through DLCP Tour Guide program.","requirements":"Application, knowledge requirements.","fees":"Varies","processing_time":"Varies"},{"id":"prof-010","name":"Funeral Director License","category":"Professional & Occupational Licenses","agency":"dlcp","description":"Required for funeral directors operating in DC.","apply_url":"https://govservices.dcra.dc.gov/oplanewlicense","how_to_apply":"Apply through DLCP.","requirements":"Education, examination, apprenticeship.","fees":"Varies","processing_time":"Varies"},{"id":"prof-011","name":"Interior Design License","category":"Professional & Occupational Licenses","agency":"dlcp","description":"Required for practicing commercial interior design in DC.","apply_url":"https://govservices.dcra.dc.gov/oplanewlicense","how_to_apply":"Apply through DLCP.","requirements":"NCIDQ certification, education, experience.","fees":"Varies","processing_time":"Varies"},{"id":"prof-012","name":"Athlete Agent License","category":"Professional & Occupational Licenses","agency":"dlcp","description":"Required for athlete agents representing athletes in DC.","apply_url":"https://govservices.dcra.dc.gov/oplanewlicense","how_to_apply":"Apply through DLCP Athlete Agent Program.","requirements":"Application, disclosure of background.","fees":"Varies","processing_time":"Varies"},{"id":"prof-013","name":"Combat Sports License","category":"Professional & Occupational Licenses","agency":"dlcp","description":"Required for combat sports promoters, fighters, referees, and other participants in DC.","apply_url":"https://govservices.dcra.dc.gov/oplanewlicense","how_to_apply":"Apply through DLCP Combat Sports program.","requirements":"Varies by role (promoter, fighter, referee, etc.).","fees":"Varies","processing_time":"Varies"},{"id":"health-001","name":"Health Professional License","category":"Health Professions","agency":"doh","description":"Required for physicians, nurses, dentists, pharmacists, psychologists, social workers, and other health professionals practicing in DC. Over 30 health profession categories.","apply_url":"https://dchealth.dc.gov/service/health-professionals","how_to_apply":"Apply through DC Health Board of respective profession.","requirements":"Varies by profession: education, exam, supervised practice, background check.","fees":"Varies by profession","processing_time":"Varies"},{"id":"animal-001","name":"Dog License","category":"Animal Permits","agency":"doh","description":"Required for all dogs in DC. Must be licensed within specified period after acquisition or moving to DC.","apply_url":"https://dchealth.dc.gov/node/164952","how_to_apply":"Apply through DC Health.","requirements":"Proof of rabies vaccination.","fees":"Varies (spayed/neutered vs intact)","processing_time":"Immediate"},{"id":"animal-002","name":"Animal Hobby Permit","category":"Animal Permits","agency":"doh","description":"Required for keeping certain animals as a hobby (e.g., chickens, bees) in residential areas.","apply_url":"https://dchealth.dc.gov/node/164972","how_to_apply":"Apply through DC Health.","requirements":"Property details, animal housing plan, neighbor notification may be required.","fees":"Varies","processing_time":"Varies"},{"id":"animal-003","name":"Exotic Animal Permit","category":"Animal Permits","agency":"doh","description":"Required for keeping exotic animals in DC. Many exotic species are prohibited.","apply_url":"https://dchealth.dc.gov/node/165112","how_to_apply":"Apply through DC Health.","requirements":"Species identification, housing plan, safety measures.","fees":"Varies","processing_time":"Varies"},{"id":"animal-004","name":"Pigeon Coop Permit","category":"Animal Permits","agency":"doh","description":"Required for keeping pigeons in DC.","apply_url":"https://dchealth.dc.gov/node/165032","how_to_apply":"Apply through DC Health.","requirements":"Coop specifications, location details.","fees":"Varies","processing_time":"Varies"},{"id":"animal-005","name":"Animal Disease Prevention Permit","category":"Animal Permits","agency":"doh","description":"Required for activities related to animal disease prevention and control in DC.","apply_url":"https://dchealth.dc.gov/node/165002","how_to_apply":"Apply through DC Health.","requirements":"Varies by activity.","fees":"Varies","processing_time":"Varies"},{"id":"parking-001","name":"Residential Parking Permit (RPP)","category":"Parking & Driving","agency":"dmv","description":"Allows DC residents to park in their designated Residential Permit Parking zone without time restrictions.","apply_url":"https://dmv.dc.gov/node/156542","how_to_apply":"Apply through DC DMV online, by mail, or in person.","requirements":"DC vehicle registration, proof of residency in RPP zone.","fees":"$35/year","processing_time":"Immediate at DMV; 7-10 days by mail"},{"id":"parking-002","name":"Visitor Parking Permit","category":"Parking & Driving","agency":"dmv","description":"Allows guests of DC residents to park in RPP zones. Limited number per household per year.","apply_url":"https://dmv.dc.gov/node/156592","how_to_apply":"Apply through DC DMV.","requirements":"DC resident with valid RPP, guest vehicle information.","fees":"Varies","processing_time":"Varies"},{"id":"parking-003","name":"Healthcare Provider Temporary Parking Permit","category":"Parking & Driving","agency":"dmv","description":"Allows healthcare providers making house calls to park in RPP zones.","apply_url":"https://dmv.dc.gov/node/156572","how_to_apply":"Apply through DC DMV.","requirements":"Healthcare provider credentials, proof of house call services.","fees":"Varies","processing_time":"Varies"},{"id":"parking-004","name":"Contractual Employee Temporary Parking Permit","category":"Parking & Driving","agency":"dmv","description":"Allows contractors working on a job in an RPP zone to park there temporarily.","apply_url":"https://dmv.dc.gov/node/156602","how_to_apply":"Apply through DC DMV.","requirements":"Proof of contract work at address in RPP zone.","fees":"Varies","processing_time":"Varies"},{"id":"driving-001","name":"Learner's Permit","category":"Parking & Driving","agency":"dmv","description":"Required first step before obtaining a DC driver's license. Allows supervised driving.","apply_url":"https://dmv.dc.gov/service/learner-permit","how_to_apply":"Apply at DC DMV service center.","requirements":"Knowledge test, vision test, identity documents, Social Security number.","fees":"$47","processing_time":"Same day (pass knowledge test)"},{"id":"driving-002","name":"Driver's License","category":"Parking & Driving","agency":"dmv","description":"Standard DC driver's license for operating a motor vehicle.","apply_url":"https://dmv.dc.gov/service/driver-licenses","how_to_apply":"Apply at DC DMV after holding learner's permit for required period.","requirements":"Learner's permit, road skills test, identity documents.","fees":"$47 (8-year license)","processing_time":"Same day (pass road test)"},{"id":"driving-003","name":"Commercial Driver's License (CDL)","category":"Parking & Driving","agency":"dmv","description":"Required for operating commercial vehicles (buses, trucks, hazmat) in DC.","apply_url":"https://dmv.dc.gov/service/obtain-commercial-driver-license","how_to_apply":"Apply at DC DMV.","requirements":"CDL knowledge test, CDL skills test, medical certificate, background check (some endorsements).","fees":"Varies","processing_time":"Varies"},{"id":"driving-004","name":"Trip Permit (Buses)","category":"Parking & Driving","agency":"dmv","description":"Required for operating charter or commercial buses on DC roads for specific trips.","apply_url":"https://dmv.dc.gov/service/obtain-trip-permit","how_to_apply":"Apply through DC DMV.","requirements":"Vehicle information, trip details, insurance.","fees":"Varies","processing_time":"Varies"},{"id":"firearm-001","name":"Firearms Registration","category":"Firearms","agency":"mpdc","description":"Required for all firearms possessed in DC. DC requires registration of every firearm.","apply_url":"https://mpdc.dc.gov/service/firearm-registration-district-columbia","how_to_apply":"Apply through MPD Firearms Registration Section.","requirements":"Background check, firearms training, vision test, ballistics test for handguns.","fees":"$13 per firearm","processing_time":"Varies"},{"id":"vital-001","name":"Marriage License","category":"Vital Records","agency":"courts","description":"Required to legally marry in DC. No waiting period, no blood test required.","apply_url":"https://www.dccourts.gov","how_to_apply":"Apply at DC Superior Court Marriage Bureau. Both parties must appear in person.","requirements":"Valid government-issued photo ID, Social Security numbers, $35 fee.","fees":"$35","processing_time":"Same day"},{"id":"vital-002","name":"Domestic Partnership Registration","category":"Vital Records","agency":"glbt","description":"Register a domestic partnership in DC.","apply_url":"https://glbt.dc.gov/page/dc-domestic-partnerships","how_to_apply":"Apply through Mayor's Office of LGBTQ Affairs.","requirements":"Both partners must appear, valid ID, meet DC requirements.","fees":"Varies","processing_time":"Varies"},{"id":"vital-003","name":"Birth Certificate Request","category":"Vital Records","agency":"doh","description":"Request a certified copy of a DC birth certificate.","apply_url":"https://dchealth.dc.gov/service/birth-certificates","how_to_apply":"Apply online or in person through DC Health Vital Records Division.","requirements":"Valid ID, relationship to person on certificate.","fees":"$23 per copy","processing_time":"Varies by method"},{"id":"vital-004","name":"Death Certificate Request","category":"Vital Records","agency":"doh","description":"Request a certified copy of a DC death certificate.","apply_url":"https://dchealth.dc.gov/service/death-certificates","how_to_apply":"Apply through DC Health Vital Records Division.","requirements":"Valid ID, relationship to decedent or legal authorization.","fees":"$18 per copy","processing_time":"Varies"},{"id":"food-006","name":"Retail Food License","category":"Food & Health","agency":"dlcp","description":"Required for retail food establishments including grocery stores, convenience stores, and specialty food shops.","apply_url":"https://dlcp.dc.gov","how_to_apply":"Apply through DLCP as part of BBL.","requirements":"Health inspection, food safety compliance, BBL.","fees":"Varies","processing_time":"Varies"}]};